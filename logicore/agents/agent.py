@@ -2,15 +2,18 @@ import time
 import json
 import inspect
 import asyncio
+import random
 import re
+import reprlib
 from typing import List, Dict, Any, Callable, Awaitable, Optional, Union, get_type_hints
 from datetime import datetime
 from logicore.providers.base import LLMProvider
-from logicore.providers.gateway import ProviderGateway, get_gateway_for_provider
+from logicore.providers.gateway import ProviderGateway, NormalizedMessage, get_gateway_for_provider
+from logicore.utils.docstrings import GOOGLE_ARG_RE, SPHINX_PARAM_RE
 from logicore.tools import ALL_TOOL_SCHEMAS, DANGEROUS_TOOLS, APPROVAL_REQUIRED_TOOLS, SAFE_TOOLS, execute_tool
 from logicore.config.prompts import get_system_prompt
 from logicore.skills import Skill, SkillLoader
-from logicore.telemetry import TelemetryTracker
+from logicore.telemetry import TelemetryTracker, TokenBreakdown
 from logicore.simplemem import AgentrySimpleMem
 import logging
 
@@ -19,26 +22,271 @@ logger = logging.getLogger(__name__)
 import sys
 import os
 from logicore.mcp_client import MCPClientManager
+
+try:
+    import orjson
+except ImportError:  # optional speedup
+    orjson = None
+
+
+def _dumps(value: Any) -> str:
+    """Serialize tool arguments/results to a JSON string, using orjson when available."""
+    if orjson is not None:
+        try:
+            return orjson.dumps(value, option=orjson.OPT_NON_STR_KEYS).decode("utf-8")
+        except TypeError:
+            pass  # e.g. integers beyond 64 bits; stdlib handles them
+    return json.dumps(value)
+
+
+def _loads(data: Union[str, bytes]) -> Any:
+    """Parse JSON (e.g. streamed tool-call arguments), using orjson when available.
+
+    orjson.JSONDecodeError subclasses json.JSONDecodeError, so callers catch
+    the same exception either way.
+    """
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+# Bounded repr for log previews: containers and long strings are elided
+# structurally, so previewing a multi-MB tool result or an image-bearing
+# message list costs the same as previewing a small one.
+_PREVIEW_REPR = reprlib.Repr()
+_PREVIEW_REPR.maxlevel = 3
+_PREVIEW_REPR.maxdict = _PREVIEW_REPR.maxlist = _PREVIEW_REPR.maxtuple = 10
+_PREVIEW_REPR.maxstring = _PREVIEW_REPR.maxother = 200
+
+# Tools that run without approval. 'computer' (Claude Computer Use) is exempt
+# alongside the registry's SAFE_TOOLS, which stays a list for concatenation.
+_APPROVAL_EXEMPT_TOOLS = frozenset(SAFE_TOOLS) | {"computer"}
+
+# Tools without side effects; adjacent calls to these may run concurrently.
+_READ_ONLY_TOOLS = frozenset(SAFE_TOOLS)
+
+
+def _text_only(content: List[Any]) -> str:
+    """Text of a multimodal content list (as extract_content joins it), without touching media."""
+    return " ".join(
+        part.get("text", "") for part in content
+        if isinstance(part, dict) and part.get("type") == "text"
+    )
+
+
+def _preview(value: Any, limit: int = 200) -> str:
+    """Short text preview of a possibly very large value."""
+    if isinstance(value, str):
+        return value[:limit]
+    return _PREVIEW_REPR.repr(value)[:limit]
+
+# Routing hints injected for reminder-style requests; built once at import.
+_SUB_MINUTE_REMINDER_HINT = (
+    "<reminder_routing_hint>\n"
+    "User requested a sub-minute reminder. Cron tools are minute-granularity and cannot satisfy seconds-level reminders. "
+    "Do not call add_cron_job for this request. Explain limitation and ask for either rounding to the next minute or explicit approval for a one-shot execution tool.\n"
+    "</reminder_routing_hint>"
+)
+_CRON_REMINDER_HINT = (
+    "<reminder_routing_hint>\n"
+    "For reminder/scheduling requests that are minute-level or greater, prefer cron tools first: add_cron_job (and list_cron_jobs to confirm). "
+    "Avoid execute_command/code_execute for scheduling when cron can handle it.\n"
+    "</reminder_routing_hint>"
+)
+
+# Reminder detection runs on every user turn and every final response, so
+# its patterns are compiled once here rather than looked up per call.
+_REMINDER_REQUEST_RE = re.compile(
+    r"\b(remind|reminder|notify|notification|ping me|in next \d+\s*(sec|second|seconds|min|minute|minutes))\b"
+)
+_REMINDER_CLAIM_RES = (
+    re.compile(r"\b(i('| wi)?ll|i can|got it)\b.*\b(remind|reminder|ping|notify)\b"),
+    re.compile(r"\b(pop|ping)\b.*\b(in\s+\d+\s*(sec|second|seconds|min|minute|minutes))\b"),
+    re.compile(r"\bi('| wi)?ll\s+.*\b(in\s+\d+\s*(sec|second|seconds|min|minute|minutes))\b"),
+)
+_REMINDER_WINDOW_RE = re.compile(r"(\d+)\s*(sec|second|seconds|min|minute|minutes|hr|hour|hours)")
+
+_EMPTY_TOOLS_SECTION_RE = re.compile(r'<available_tools>\s*</available_tools>')
+
+# Seconds per unit token accepted by _extract_reminder_window_seconds.
+_REMINDER_UNIT_SECONDS = {
+    "sec": 1, "second": 1, "seconds": 1,
+    "min": 60, "minute": 60, "minutes": 60,
+    "hr": 3600, "hour": 3600, "hours": 3600,
+}
+
+# Provider errors worth retrying: throttling, and transient empty/invalid output
+# (a bare "429" would also match token counts and request ids in the text)
+_RATE_LIMIT_MARKERS = (
+    "rate limit",
+    "rate_limit",
+    "status code: 429",
+    "error code: 429",
+    "too many requests",
+    "overloaded",
+)
+_RETRYABLE_ERROR_MARKERS = (
+    "empty",
+    "tool calls",
+    "model output must contain",
+    "output text or tool calls",
+    "unexpected",
+    "does not support tools",
+    "internal server error",
+    "status code: -1",
+    "status code: 500",
+)
+
+
+def _error_status(error: Optional[BaseException]) -> Optional[int]:
+    """HTTP status carried by a provider SDK exception, if it exposes one."""
+    status = getattr(error, "status_code", None)
+    if status is None:
+        status = getattr(getattr(error, "response", None), "status_code", None)
+    return status if isinstance(status, int) else None
+
+
+def _classify_llm_error(error_str: str, error: Optional[BaseException] = None) -> str:
+    """Classify a lowercased provider error as 'rate_limit', 'empty_response' or 'other'."""
+    if _error_status(error) == 429 or any(marker in error_str for marker in _RATE_LIMIT_MARKERS):
+        return "rate_limit"
+    if any(marker in error_str for marker in _RETRYABLE_ERROR_MARKERS):
+        return "empty_response"
+    return "other"
+
+
+def _backoff_delay(attempt: int, base: float) -> float:
+    """Exponential backoff (capped at 8s) with up to `base` seconds of jitter."""
+    return min(8.0, base * 2 ** attempt) + random.uniform(0, base)
+
+
+# Python annotation -> JSON schema type for register_tool_from_function
+_PY_TO_JSON = {int: "integer", float: "number", bool: "boolean", list: "array", dict: "object", str: "string"}
+
+# Provider name -> factory(model, api_key, endpoint). Each factory imports its
+# provider module on first use, so only the SDK actually selected gets loaded.
+_PROVIDER_FACTORIES: Dict[str, Callable[[Optional[str], Optional[str], Optional[str]], LLMProvider]] = {}
+
+
+def _register_provider(name: str):
+    def decorator(factory):
+        _PROVIDER_FACTORIES[name] = factory
+        return factory
+    return decorator
+
+
+@_register_provider("ollama")
+def _ollama_provider(model, api_key, endpoint):
+    from logicore.providers.ollama_provider import OllamaProvider
+    return OllamaProvider(model_name=model or "gpt-oss:20b-cloud")
+
+
+@_register_provider("groq")
+def _groq_provider(model, api_key, endpoint):
+    from logicore.providers.groq_provider import GroqProvider
+    return GroqProvider(model_name=model or "llama-3.3-70b-versatile", api_key=api_key)
+
+
+@_register_provider("gemini")
+def _gemini_provider(model, api_key, endpoint):
+    from logicore.providers.gemini_provider import GeminiProvider
+    return GeminiProvider(model_name=model or "gemini-pro", api_key=api_key)
+
+
+@_register_provider("azure")
+def _azure_provider(model, api_key, endpoint):
+    from logicore.providers.azure_provider import AzureProvider
+    return AzureProvider(model_name=model, api_key=api_key, endpoint=endpoint)
+
+
+@_register_provider("openai")
+def _openai_provider(model, api_key, endpoint):
+    from logicore.providers.openai_provider import OpenAIProvider
+    return OpenAIProvider(model_name=model or "gpt-4", api_key=api_key)
+
+
 class AgentSession:
     """Represents a conversation session."""
-    def __init__(self, session_id: str, system_message: str):
+    def __init__(
+        self,
+        session_id: str,
+        system_message: str,
+        max_history_messages: Optional[int] = None,
+        summary_ratio: float = 0.25,
+        summarizer: Optional[Callable[[List[Dict[str, Any]]], str]] = None,
+    ):
         self.session_id = session_id
         self.messages: List[Dict[str, Any]] = [{"role": "system", "content": system_message}]
+        # Optional sliding window: once the history exceeds max_history_messages,
+        # the oldest summary_ratio share of it is folded into one summary message
+        self.max_history_messages = max_history_messages
+        self.summary_ratio = summary_ratio
+        self.summarizer = summarizer
+        self.omitted_messages = 0
+        self._summary_msg: Optional[Dict[str, Any]] = None
         self.created_at = datetime.now()
-        self.last_activity = datetime.now()
+        # Touched on every message, so kept as a raw timestamp and only turned
+        # into a datetime when someone reads last_activity.
+        self._last_activity_ts = time.time()
         self.metadata: Dict[str, Any] = {}
         self.files: Dict[str, str] = {} # VFS: Filename -> Content
+
+    @property
+    def last_activity(self) -> datetime:
+        return datetime.fromtimestamp(self._last_activity_ts)
+
+    @last_activity.setter
+    def last_activity(self, value: datetime):
+        self._last_activity_ts = value.timestamp()
     
     def add_message(self, message: Dict[str, Any]):
         self.messages.append(message)
-        self.last_activity = datetime.now()
+        self._last_activity_ts = time.time()
+        if self.max_history_messages and len(self.messages) > self.max_history_messages:
+            self._compact_history()
+
+    def _compact_history(self):
+        """Fold the oldest non-system messages into a single summary message, in place."""
+        messages = self.messages
+        head = 0
+        while head < len(messages) and messages[head].get('role') == 'system':
+            head += 1
+        end = head + max(1, int(self.max_history_messages * self.summary_ratio))
+        # Never keep tool results whose assistant tool_calls message is dropped
+        while end < len(messages) and messages[end].get('role') == 'tool':
+            end += 1
+        if end >= len(messages):
+            return  # nothing recent left to keep
+
+        dropped = messages[head:end]
+        if self.summarizer:
+            summary = self.summarizer(dropped)
+        else:
+            # O(1) default: no extra LLM call, just record how much was cut
+            self.omitted_messages += sum(1 for m in dropped if m is not self._summary_msg)
+            summary = f"…{self.omitted_messages} messages omitted…"
+        # A user-role note, so the turns after the system prompt still open
+        # with a user message as Anthropic and others require
+        self._summary_msg = {"role": "user", "content": f"[earlier context: {summary}]"}
+        messages[head:end] = [self._summary_msg]
     
     def clear_history(self, keep_system: bool = True):
-        if keep_system:
-            self.messages = [msg for msg in self.messages if msg.get('role') == 'system']
+        messages = self.messages
+        self.omitted_messages = 0
+        self._summary_msg = None
+        if not keep_system:
+            messages.clear()
         else:
-            self.messages = []
-        self.last_activity = datetime.now()
+            # System messages (base prompt, project context) normally lead the
+            # history, so usually the tail can just be truncated in place.
+            head = 0
+            while head < len(messages) and messages[head].get('role') == 'system':
+                head += 1
+            if any(messages[i].get('role') == 'system' for i in range(head, len(messages))):
+                messages[head:] = [msg for msg in messages[head:] if msg.get('role') == 'system']
+            else:
+                del messages[head:]
+        self._last_activity_ts = time.time()
 
 class Agent:
     """
@@ -66,7 +314,9 @@ class Agent:
         memory: bool = False,
         context_compression: bool = False,
         skills: list = None,
-        workspace_root: str = None
+        workspace_root: str = None,
+        short_circuit_on_full_denial: bool = False,
+        max_history_messages: int = None
     ):
         if isinstance(llm, str):
             self.provider = self._create_provider(llm, model, api_key, endpoint)
@@ -130,8 +380,12 @@ class Agent:
         # Tool Management
         self.internal_tools = []  # List of schemas
         self.mcp_managers: List[MCPClientManager] = []
+        self._mcp_tool_index: Dict[str, MCPClientManager] = {}  # tool name -> owning manager
         self.custom_tool_executors: Dict[str, Callable] = {}
         self.disabled_tools = set()
+        # Aggregated tool list from get_all_tools, reused while the toolset is unchanged
+        self._tools_cache: Optional[List[Dict[str, Any]]] = None
+        self._tools_cache_key = None
         
         # Skills Management
         self.skills: List[Skill] = []
@@ -140,6 +394,7 @@ class Agent:
         
         # Session Management
         self.sessions: Dict[str, AgentSession] = {}
+        self.max_history_messages = max_history_messages  # None = unbounded history
         
         # Execution Tracking
         self.execution_log: List[str] = []
@@ -187,6 +442,8 @@ class Agent:
         
         # Tool Approval Control
         self.auto_approve_all = False  # Set to True to skip all approval checks
+        # End the turn with a canned reply (no extra LLM call) when every tool call was denied
+        self.short_circuit_on_full_denial = short_circuit_on_full_denial
 
     @property
     def system_prompt(self) -> str:
@@ -222,9 +479,7 @@ class Agent:
             # User provided a custom system message - replace any empty tools section or append
             if "<available_tools>" in self._custom_system_message:
                 # Replace the empty <available_tools> section with actual formatter tools
-                import re
-                self.default_system_message = re.sub(
-                    r'<available_tools>\s*</available_tools>',
+                self.default_system_message = _EMPTY_TOOLS_SECTION_RE.sub(
                     tools_section.strip() if tools_section else "",
                     self._custom_system_message
                 )
@@ -270,34 +525,15 @@ class Agent:
         
         When adding a new provider:
         1. Create the provider class in logicore/providers/
-        2. Add it here in the factory
+        2. Register a factory for it with @_register_provider
         3. Create a corresponding gateway class in logicore/providers/gateway.py
         4. Update the get_gateway_for_provider() function in gateway.py
         """
-        provider_name = provider_name.lower()
-        
-        if provider_name == "ollama":
-            from logicore.providers.ollama_provider import OllamaProvider
-            return OllamaProvider(model_name=model or "gpt-oss:20b-cloud")
-            
-        elif provider_name == "groq":
-            from logicore.providers.groq_provider import GroqProvider
-            return GroqProvider(model_name=model or "llama-3.3-70b-versatile", api_key=api_key)
-            
-        elif provider_name == "gemini":
-            from logicore.providers.gemini_provider import GeminiProvider
-            return GeminiProvider(model_name=model or "gemini-pro", api_key=api_key)
-            
-        elif provider_name == "azure":
-            from logicore.providers.azure_provider import AzureProvider
-            return AzureProvider(model_name=model, api_key=api_key, endpoint=endpoint)
-        
-        elif provider_name == "openai":
-            from logicore.providers.openai_provider import OpenAIProvider
-            return OpenAIProvider(model_name=model or "gpt-4", api_key=api_key)
-            
-        else:
-            raise ValueError(f"Unknown provider: {provider_name}. Supported: 'ollama', 'groq', 'gemini', 'azure', 'openai'.")
+        factory = _PROVIDER_FACTORIES.get(provider_name.lower())
+        if factory is None:
+            supported = ", ".join(f"'{name}'" for name in _PROVIDER_FACTORIES)
+            raise ValueError(f"Unknown provider: {provider_name.lower()}. Supported: {supported}.")
+        return factory(model, api_key, endpoint)
 
 
     # --- Skill Management ---
@@ -401,6 +637,7 @@ class Agent:
     def load_default_tools(self):
         """Load all built-in tools (Filesystem, Web, Execution)."""
         self.internal_tools.extend(ALL_TOOL_SCHEMAS)
+        self._invalidate_tools_cache()
         self.supports_tools = True
         # Auto-load default skills from package defaults
         self._load_default_skills()
@@ -465,6 +702,8 @@ class Agent:
         for manager in self.mcp_managers:
             await manager.cleanup()
         self.mcp_managers = []
+        self._mcp_tool_index = {}
+        self._invalidate_tools_cache()
         if self.debug:
             print("[Agent] Cleared all MCP servers")
 
@@ -473,6 +712,8 @@ class Agent:
         manager = MCPClientManager(config_path, config=config)
         await manager.connect_to_servers()
         self.mcp_managers.append(manager)
+        self._index_mcp_tools()
+        self._invalidate_tools_cache()
         if self.debug:
             source = "memory" if config else config_path
             print(f"[Agent] Added MCP servers from {source}")
@@ -480,6 +721,7 @@ class Agent:
     def add_custom_tool(self, schema: Dict[str, Any], executor: Callable):
         """Add a single custom tool with its schema and execution function."""
         self.internal_tools.append(schema)
+        self._invalidate_tools_cache()
         tool_name = schema.get("function", {}).get("name")
         if tool_name:
             self.custom_tool_executors[tool_name] = executor
@@ -493,9 +735,6 @@ class Agent:
         Automatically registers a Python function as a tool.
         Generates the schema from the function's signature and docstring.
         """
-        import inspect
-        import re
-        
         name = func.__name__
         raw_doc = func.__doc__ or "No description provided."
         
@@ -510,7 +749,7 @@ class Agent:
             stripped = line.strip()
             
             # Sphinx style: :param name: description
-            sphinx_match = re.match(r':param\s+(\w+)\s*:(.*)', stripped)
+            sphinx_match = SPHINX_PARAM_RE.match(stripped)
             if sphinx_match:
                 param_docs[sphinx_match.group(1)] = sphinx_match.group(2).strip()
                 continue
@@ -527,7 +766,7 @@ class Agent:
             
             if in_args_section and stripped:
                 # Google style: "param_name (type): description" or "param_name: description"
-                arg_match = re.match(r'(\w+)\s*(?:\([^)]*\))?\s*:(.*)', stripped)
+                arg_match = GOOGLE_ARG_RE.match(stripped)
                 if arg_match:
                     param_docs[arg_match.group(1)] = arg_match.group(2).strip()
                 continue
@@ -538,7 +777,8 @@ class Agent:
         description = ' '.join(description_lines) if description_lines else raw_doc.strip()
         
         sig = inspect.signature(func)
-        type_hints = get_type_hints(func)
+        # get_type_hints resolves every annotation; skip it for untyped helpers
+        type_hints = get_type_hints(func) if getattr(func, '__annotations__', None) else {}
         
         parameters = {
             "type": "object",
@@ -550,13 +790,7 @@ class Agent:
             if param_name == 'self': continue
             
             # Map Python types to JSON types
-            py_type = type_hints.get(param_name, str)
-            json_type = "string"
-            if py_type == int: json_type = "integer"
-            elif py_type == float: json_type = "number"
-            elif py_type == bool: json_type = "boolean"
-            elif py_type == list: json_type = "array"
-            elif py_type == dict: json_type = "object"
+            json_type = _PY_TO_JSON.get(type_hints.get(param_name, str), "string")
             
             # Use parsed docstring description, fallback to readable default
             pdesc = param_docs.get(param_name, f"The {param_name.replace('_', ' ')} value")
@@ -580,8 +814,26 @@ class Agent:
         
         self.add_custom_tool(schema, func)
 
+    def _tools_signature(self) -> tuple:
+        """Cheap fingerprint of everything get_all_tools depends on."""
+        return (
+            id(self.internal_tools),
+            len(self.internal_tools),
+            frozenset(self.disabled_tools),
+            tuple((id(m), len(m.sessions), len(m.server_tools_map)) for m in self.mcp_managers),
+        )
+
     async def get_all_tools(self) -> List[Dict[str, Any]]:
-        """Aggregate all tools (Internal + MCP), filtering out disabled ones."""
+        """
+        Aggregate all tools (Internal + MCP), filtering out disabled ones.
+        
+        The result is cached and the same list is returned on every call while
+        the toolset is unchanged, so treat it as read-only.
+        """
+        key = self._tools_signature()
+        if self._tools_cache is not None and self._tools_cache_key == key:
+            return self._tools_cache
+
         filtered_tools = []
         
         # Process Internal Tools
@@ -591,9 +843,9 @@ class Agent:
             if name and name not in self.disabled_tools and f"builtin:{name}" not in self.disabled_tools:
                 filtered_tools.append(tool)
         
-        # Process MCP Tools
-        for manager in self.mcp_managers:
-            mcp_tools = await manager.get_tools()
+        # Process MCP Tools (managers are queried concurrently)
+        mcp_tool_lists = await asyncio.gather(*(manager.get_tools() for manager in self.mcp_managers))
+        for manager, mcp_tools in zip(self.mcp_managers, mcp_tool_lists):
             for tool in mcp_tools:
                 name = tool.get("function", {}).get("name")
                 # Find which server this tool belongs to (manager should know)
@@ -609,15 +861,31 @@ class Agent:
                     if tool_id not in self.disabled_tools and name not in self.disabled_tools:
                         filtered_tools.append(tool)
             
+        self._tools_cache = filtered_tools
+        self._tools_cache_key = key
         return filtered_tools
 
+    def _invalidate_tools_cache(self):
+        self._tools_cache = None
+
+    def _index_mcp_tools(self):
+        """Rebuild the tool name -> MCP manager index (first manager wins, as before)."""
+        index: Dict[str, MCPClientManager] = {}
+        for manager in self.mcp_managers:
+            for tool_name in manager.server_tools_map:
+                index.setdefault(tool_name, manager)
+        self._mcp_tool_index = index
+
     # --- Session Management ---
 
     def get_session(self, session_id: str = "default") -> AgentSession:
         """Get or create a session."""
-        if session_id not in self.sessions:
-            self.sessions[session_id] = AgentSession(session_id, self.default_system_message)
-        return self.sessions[session_id]
+        session = self.sessions.get(session_id)
+        if session is None:
+            session = self.sessions[session_id] = AgentSession(
+                session_id, self.default_system_message, max_history_messages=self.max_history_messages
+            )
+        return session
 
     def clear_session(self, session_id: str = "default"):
         if session_id in self.sessions:
@@ -631,39 +899,20 @@ class Agent:
 
     def _is_reminder_like_request(self, text: Any) -> bool:
         request = str(text or "").lower()
-        return bool(
-            re.search(
-                r"\b(remind|reminder|notify|notification|ping me|in next \d+\s*(sec|second|seconds|min|minute|minutes))\b",
-                request,
-            )
-        )
+        return bool(_REMINDER_REQUEST_RE.search(request))
 
     def _has_unverified_reminder_claim(self, content: str) -> bool:
         response = (content or "").lower()
-        claim_patterns = [
-            r"\b(i('| wi)?ll|i can|got it)\b.*\b(remind|reminder|ping|notify)\b",
-            r"\b(pop|ping)\b.*\b(in\s+\d+\s*(sec|second|seconds|min|minute|minutes))\b",
-            r"\bi('| wi)?ll\s+.*\b(in\s+\d+\s*(sec|second|seconds|min|minute|minutes))\b",
-        ]
-        return any(re.search(pattern, response) for pattern in claim_patterns)
+        return any(pattern.search(response) for pattern in _REMINDER_CLAIM_RES)
 
     def _extract_reminder_window_seconds(self, text: Any) -> Optional[int]:
         request = str(text or "").lower()
 
-        m = re.search(r"(\d+)\s*(sec|second|seconds|min|minute|minutes|hr|hour|hours)", request)
+        m = _REMINDER_WINDOW_RE.search(request)
         if not m:
             return None
 
-        value = int(m.group(1))
-        unit = m.group(2)
-
-        if unit.startswith("sec"):
-            return value
-        if unit.startswith("min"):
-            return value * 60
-        if unit.startswith("hr") or unit.startswith("hour"):
-            return value * 3600
-        return None
+        return int(m.group(1)) * _REMINDER_UNIT_SECONDS[m.group(2)]
 
     def _build_reminder_routing_hint(self, text: Any, tool_names: List[str]) -> Optional[str]:
         if not self._is_reminder_like_request(text):
@@ -673,20 +922,10 @@ class Agent:
         has_cron = "add_cron_job" in tool_names
 
         if seconds is not None and seconds < 60:
-            return (
-                "<reminder_routing_hint>\n"
-                "User requested a sub-minute reminder. Cron tools are minute-granularity and cannot satisfy seconds-level reminders. "
-                "Do not call add_cron_job for this request. Explain limitation and ask for either rounding to the next minute or explicit approval for a one-shot execution tool.\n"
-                "</reminder_routing_hint>"
-            )
+            return _SUB_MINUTE_REMINDER_HINT
 
         if has_cron:
-            return (
-                "<reminder_routing_hint>\n"
-                "For reminder/scheduling requests that are minute-level or greater, prefer cron tools first: add_cron_job (and list_cron_jobs to confirm). "
-                "Avoid execute_command/code_execute for scheduling when cron can handle it.\n"
-                "</reminder_routing_hint>"
-            )
+            return _CRON_REMINDER_HINT
 
         return None
 
@@ -701,11 +940,9 @@ class Agent:
         **kwargs
     ) -> str:
         """Main chat loop."""
-        from logicore.providers.utils import extract_content
-        
         # Initialize execution tracking for this chat
         self.execution_log = []
-        user_req_str = user_input if isinstance(user_input, str) else str(user_input)[:200]
+        user_req_str = user_input if isinstance(user_input, str) else _preview(user_input)
         self.execution_log.append(f"Agent Started Task. User Request: {user_req_str}")
         
         # Merge ephemeral callbacks
@@ -727,7 +964,7 @@ class Agent:
         # --- Handle Multimodal Input ---
         text_for_memory = user_input
         if isinstance(user_input, list):
-            text_for_memory, _ = extract_content(user_input)
+            text_for_memory = _text_only(user_input)
 
         # --- Dynamic Capability Detection ---
         if self.capabilities.detection_method == "default":
@@ -807,6 +1044,11 @@ class Agent:
             })
             reminder_hint_added = True
 
+        # Stream tokens whenever an on_token callback is set and the provider can;
+        # both are fixed for the whole turn, so resolve them once.
+        on_token = active_callbacks.get("on_token")
+        has_stream = hasattr(self.provider, 'chat_stream')
+
         for i in range(self.max_iterations):
             if self.debug:
                 print(f"\n[Agent] 🔄 ITERATION {i+1}/{self.max_iterations}")
@@ -827,21 +1069,18 @@ class Agent:
                 if self.context_compression and self.context_middleware:
                     llm_messages = await self.context_middleware.manage_context(llm_messages)
 
-                if not self.capabilities.supports_vision:
-                    from logicore.providers.utils import extract_content
-                    stripped = []
-                    for m in llm_messages:
-                        m_copy = m.copy()
-                        if m.get("role") == "user" and isinstance(m.get("content"), list):
-                            text, _ = extract_content(m.get("content"))
-                            m_copy["content"] = text
-                        stripped.append(m_copy)
-                    llm_messages = stripped
-
-                # Use streaming if on_token callback is set and provider supports it
-                on_token = active_callbacks.get("on_token")
-                has_stream = hasattr(self.provider, 'chat_stream')
-                
+                if not self.capabilities.supports_vision and any(
+                    m.get("role") == "user" and isinstance(m.get("content"), list) for m in llm_messages
+                ):
+                    # Only multimodal user turns are rebuilt (text parts only, so
+                    # images are never decoded/downloaded just to be dropped);
+                    # every other message is passed through as-is.
+                    llm_messages = [
+                        {**m, "content": _text_only(m["content"])}
+                        if m.get("role") == "user" and isinstance(m.get("content"), list) else m
+                        for m in llm_messages
+                    ]
+
                 if self.debug:
                     print(f"[Agent] 🎯 Streaming: on_token={on_token is not None}, support={has_stream}")
                 
@@ -859,54 +1098,28 @@ class Agent:
             except Exception as e:
                 # Error handling & Retry logic
                 error_str = str(e).lower()
+                error_kind = _classify_llm_error(error_str, e)
                 
-                # Broaden the check for empty/invalid response errors and now Internal Server Errors
-                if (
-                    "empty" in error_str 
-                    or "tool calls" in error_str 
-                    or "model output must contain" in error_str
-                    or "output text or tool calls" in error_str
-                    or "unexpected" in error_str
-                    or "does not support tools" in error_str
-                    or "internal server error" in error_str
-                    or "status code: -1" in error_str
-                    or "status code: 500" in error_str
-                ):
-                    if self.debug or "internal server error" in error_str: 
+                if error_kind != "other":
+                    if self.debug or error_kind == "rate_limit" or "internal server error" in error_str: 
                         print(f"[Agent] ⚠️ Provider error: {error_str[:80]}... Retrying...")
                     
-                    # Retry loop with tools
-                    retry_success = False
                     try:
-                        await asyncio.sleep(1) # Short delay
-                        response = await self.gateway.chat(session.messages, tools=all_tools)
-                        retry_success = True
-                    except Exception as retry_error:
-                        retry_error_str = str(retry_error).lower()
-                        if "does not support tools" in retry_error_str:
-                            if self.debug: print(f"[Agent] ⚠️ Model doesn't support tools. Switching to no-tool mode.")
-                            break # Stop retrying with tools immediately
-                                            
-                    if not retry_success:
-                        # Fallback to no tools as a last resort
-                        if self.debug: print(f"[Agent] 🔄 Falling back to inference without tools...")
-                        try:
-                            await asyncio.sleep(1)
-                            response = await self.gateway.chat(session.messages, tools=None)
-                        except Exception as fallback_error:
-                            # Last resort: return friendly error message
-                            error_msg = f"I encountered an error from the model: {str(fallback_error)}. Please try again."
-                            if self.debug: 
-                                print(f"[Agent] ❌ All retries exhausted: {fallback_error}")
-                            # Finalize summary with error
-                            self.execution_log.append(f"Failed: LLM error exhausted retries. {fallback_error}")
-                            if generate_walkthrough:
-                                walkthrough = await self._generate_walkthrough_summary(session_id, active_callbacks, stream)
-                                if walkthrough:
-                                    error_msg += f"\n\n---\n### Walkthrough Summary\n{walkthrough}"
-                            if active_callbacks["on_final_message"]:
-                                active_callbacks["on_final_message"](session_id, error_msg)
-                            return error_msg
+                        response = await self._retry_chat(session.messages, all_tools, error_kind)
+                    except Exception as fallback_error:
+                        # Last resort: return friendly error message
+                        error_msg = f"I encountered an error from the model: {str(fallback_error)}. Please try again."
+                        if self.debug: 
+                            print(f"[Agent] ❌ All retries exhausted: {fallback_error}")
+                        # Finalize summary with error
+                        self.execution_log.append(f"Failed: LLM error exhausted retries. {fallback_error}")
+                        if generate_walkthrough:
+                            walkthrough = await self._generate_walkthrough_summary(session_id, active_callbacks, stream, session=session)
+                            if walkthrough:
+                                error_msg += f"\n\n---\n### Walkthrough Summary\n{walkthrough}"
+                        if active_callbacks["on_final_message"]:
+                            active_callbacks["on_final_message"](session_id, error_msg)
+                        return error_msg
                 else:
                     # Different error
                     print(f"\n[Agent] ❌ Runtime Error: {e}")
@@ -917,7 +1130,7 @@ class Agent:
                     error_msg = f"Error during execution: {str(e)}"
                     self.execution_log.append(f"Failed with runtime error: {e}")
                     if generate_walkthrough:
-                        walkthrough = await self._generate_walkthrough_summary(session_id, active_callbacks, stream)
+                        walkthrough = await self._generate_walkthrough_summary(session_id, active_callbacks, stream, session=session)
                         if walkthrough:
                             error_msg += f"\n\n---\n### Walkthrough Summary\n{walkthrough}"
                     return error_msg
@@ -928,16 +1141,7 @@ class Agent:
 
             # 2. Parse Response (Gateway returns NormalizedMessage)
             try:
-                from logicore.providers.gateway import NormalizedMessage
-                
-                # Response is now a NormalizedMessage from gateway
-                if isinstance(response, NormalizedMessage):
-                    content = response.content
-                    tool_calls = response.tool_calls
-                else:
-                    # Fallback for any non-normalized responses
-                    content = getattr(response, 'content', str(response))
-                    tool_calls = getattr(response, 'tool_calls', [])
+                content, tool_calls, msg_dict = self._parse_response(response)
                 
                 if self.debug:
                     print(f"[Agent] Response parsed - Content length: {len(content) if content else 0}, Tool calls: {len(tool_calls) if tool_calls else 0}")
@@ -948,28 +1152,18 @@ class Agent:
                             tool_name = tc['function']['name'] if isinstance(tc, dict) else tc.function.name
                             print(f"[Agent]   Tool call {idx+1}: '{tool_name}'")
                 
-                # Convert to dict for session history
-                msg_dict = {
-                    "role": "assistant",
-                    "content": content
-                }
-                if tool_calls:
-                    msg_dict["tool_calls"] = tool_calls
-                
                 session.add_message(msg_dict)
                 
                 # Record telemetry if enabled
                 if self.telemetry_enabled:
                     try:
-                        from logicore.telemetry import TokenBreakdown
-                        
                         llm_end_time = time.time()
                         duration_ms = (llm_end_time - llm_start_time) * 1000
                         
                         # Approximate token counts currently (1 token ~ 4 chars)
                         system_chars = sum(len(str(m.get("content", ""))) for m in session.messages if m.get("role") == "system")
                         message_chars = sum(len(str(m.get("content", ""))) for m in session.messages if m.get("role") != "system" and m.get("role") != "assistant")
-                        tools_chars = len(json.dumps(all_tools)) if all_tools else 0
+                        tools_chars = len(_dumps(all_tools)) if all_tools else 0
                         output_chars = len(str(content or ""))
                         
                         breakdown = TokenBreakdown(
@@ -1011,11 +1205,7 @@ class Agent:
             # 3. Handle Final Response
             if not tool_calls:
                 if reminder_hint_added:
-                    for idx in range(len(session.messages) - 1, -1, -1):
-                        msg = session.messages[idx]
-                        if msg.get("role") == "system" and msg.get("content") == reminder_hint:
-                            del session.messages[idx]
-                            break
+                    self._remove_system_hint(session, reminder_hint)
 
                 if (
                     self._is_reminder_like_request(text_for_memory)
@@ -1042,7 +1232,7 @@ class Agent:
                 
                 if generate_walkthrough:
                     if self.debug: print(f"[Agent] 📝 Generating walkthrough summary...")
-                    walkthrough = await self._generate_walkthrough_summary(session_id, active_callbacks, stream)
+                    walkthrough = await self._generate_walkthrough_summary(session_id, active_callbacks, stream, session=session)
                     if walkthrough:
                         content += f"\n\n---\n### Walkthrough Summary\n{walkthrough}"
 
@@ -1051,6 +1241,11 @@ class Agent:
                 return content
 
             # 4. Execute Tools
+            # Approvals are user-facing, so they are resolved one call at a
+            # time; the approved calls are then dispatched (see
+            # _execute_approved) and their results handled in the order the
+            # model issued them.
+            pending = []
             for tc in tool_calls:       
                 
                 # Extract details
@@ -1066,14 +1261,14 @@ class Agent:
                 # Robustly ensure args is a mapping
                 if isinstance(args, str):
                     try:
-                        args = json.loads(args)
+                        args = _loads(args)
                     except json.JSONDecodeError:
                         # If it's not valid JSON, keep it as is and let execution fail gracefully
                         pass
                 
 
                 # Format tool parameters for logging (first 100 words)
-                params_str = json.dumps(args) if isinstance(args, dict) else str(args)
+                params_str = _dumps(args) if isinstance(args, dict) else (args if isinstance(args, str) else str(args))
                 params_preview = (params_str[:150] + "...") if len(params_str) > 150 else params_str
 
                 # Increment tool call telemetry if enabled
@@ -1126,19 +1321,28 @@ class Agent:
                         if self.debug:
                             print(f"[Agent] 🔒 Approval required for '{name}' but no callback configured; denying execution.")
 
+                if not approved and not (isinstance(result, dict) and "error" in result):
+                    result = {"error": "Denied by user"}
+
+                pending.append((name, args, tc_id, approved, result))
+
+            executed = iter(await self._execute_approved(
+                [(name, args) for name, args, _, approved, _ in pending if approved],
+                session_id,
+            ))
+
+            for name, args, tc_id, approved, result in pending:
+                result_json = None  # Serialized dict result, reused for the history entry
                 if not approved:
-                    if 'result' not in locals() or not isinstance(result, dict) or "error" not in result:
-                        result = {"error": "Denied by user"}
                     tool_fail_log = f"[Agent] ❌ EXECUTION DENIED: '{name}'"
                     print(tool_fail_log)
                     logger.warning(tool_fail_log)
                     # Track denied tool call in summary
                     self.execution_log.append(f"Tool {name} was denied. Reason: {result.get('error', 'Denied by user')}")
                 else:
-                    # Record tool call start time
-                    start_time_tool = time.time()
-                    result = await self._execute_tool(name, args, session_id)
-                    duration_ms = (time.time() - start_time_tool) * 1000
+                    result = next(executed)
+                    if isinstance(result, BaseException):
+                        result = {"error": str(result)}
                     
                     # Check if tool execution was successful
                     is_error = False
@@ -1147,16 +1351,18 @@ class Agent:
                     
                     if is_error:
                         error_msg = result.get("error", result.get("exception", "Unknown error"))
-                        tool_fail_log = f"[Agent] ❌ TOOL FAILED: '{name}' | Error: {str(error_msg)[:80]}..."
+                        tool_fail_log = f"[Agent] ❌ TOOL FAILED: '{name}' | Error: {_preview(error_msg, 80)}..."
                         print(tool_fail_log)
                         logger.error(tool_fail_log)
                         # Track failed tool call in summary
-                        self.execution_log.append(f"Tool {name} FAILED with error: {error_msg}")
+                        self.execution_log.append(f"Tool {name} FAILED with error: {_preview(error_msg, 500)}")
                     else:
                         successful_tools_this_chat += 1
                         # Format result summary (up to 100 words)
                         if isinstance(result, dict):
-                            result_str = json.dumps(result)
+                            result_json = result_str = _dumps(result)
+                        elif isinstance(result, str):
+                            result_str = result
                         else:
                             result_str = str(result)
                         result_preview = (result_str[:120] + "...") if len(result_str) > 120 else result_str
@@ -1181,7 +1387,7 @@ class Agent:
                     if "message" in result and "status" in result:
                         result_summary = f"{result.get('status', 'executed')}: {result['message']}"
                     else:
-                        result_summary = json.dumps(result)
+                        result_summary = result_json if result_json is not None else _dumps(result)
                 
                 tool_msg = {
                     "role": "tool",
@@ -1193,18 +1399,83 @@ class Agent:
                 
                 session.add_message(tool_msg)
 
+            # Every call this round was denied: reply directly instead of
+            # spending another full generation on reacting to the denial
+            if self.short_circuit_on_full_denial and not any(approved for _, _, _, approved, _ in pending):
+                if reminder_hint_added:
+                    self._remove_system_hint(session, reminder_hint)
+                content = "I stopped because the requested actions were denied. Let me know how you'd like to proceed."
+                session.add_message({"role": "assistant", "content": content})
+                self.execution_log.append("Task stopped: all requested tool calls were denied.")
+                if active_callbacks["on_final_message"]:
+                    active_callbacks["on_final_message"](session_id, content)
+                return content
+
         # Max iterations reached
         self.execution_log.append("Execution timed out: Max iterations reached.")
             
         final_msg = "Max iterations reached."
         if generate_walkthrough:
-            walkthrough = await self._generate_walkthrough_summary(session_id, active_callbacks, stream)
+            walkthrough = await self._generate_walkthrough_summary(session_id, active_callbacks, stream, session=session)
             if walkthrough:
                 final_msg += f"\n\n---\n### Walkthrough Summary\n{walkthrough}"
                 
         return final_msg
 
-    async def _generate_walkthrough_summary(self, session_id: str, active_callbacks: dict, stream: bool = False) -> str:
+    @staticmethod
+    def _remove_system_hint(session: AgentSession, hint: str):
+        """Drop the most recent system message carrying ``hint`` from the history."""
+        for idx in range(len(session.messages) - 1, -1, -1):
+            msg = session.messages[idx]
+            if msg.get("role") == "system" and msg.get("content") == hint:
+                del session.messages[idx]
+                break
+
+    async def _retry_chat(self, messages: List[Dict[str, Any]], tools: Optional[List[Dict[str, Any]]], error_kind: str = "empty_response") -> Any:
+        """
+        Retry a failed LLM call with exponential backoff and jitter.
+        
+        Rate limits get more attempts from a longer base delay. If the retries
+        with tools fail, a final attempt is made without tools; its error, if
+        any, propagates to the caller.
+        """
+        attempts, base = (3, 1.0) if error_kind == "rate_limit" else (1, 0.25)
+        for attempt in range(attempts):
+            await asyncio.sleep(_backoff_delay(attempt, base))
+            try:
+                return await self.gateway.chat(messages, tools=tools)
+            except Exception as retry_error:
+                retry_error_str = str(retry_error).lower()
+                if "does not support tools" in retry_error_str:
+                    if self.debug: print(f"[Agent] ⚠️ Model doesn't support tools. Switching to no-tool mode.")
+                    break # Stop retrying with tools immediately
+                if _classify_llm_error(retry_error_str, retry_error) == "rate_limit":
+                    base = max(base, 1.0)
+
+        # Fallback to no tools as a last resort
+        if self.debug: print(f"[Agent] 🔄 Falling back to inference without tools...")
+        await asyncio.sleep(_backoff_delay(attempts, base))
+        return await self.gateway.chat(messages, tools=None)
+
+    @staticmethod
+    def _parse_response(response: Any) -> tuple:
+        """Split a gateway response into (content, tool_calls, history message)."""
+        # The gateway normalizes every provider, so this is the common case
+        if isinstance(response, NormalizedMessage):
+            content = response.content
+            tool_calls = response.tool_calls
+        else:
+            # Fallback for any non-normalized responses
+            content = getattr(response, 'content', str(response))
+            tool_calls = getattr(response, 'tool_calls', [])
+
+        # Convert to dict for session history
+        msg_dict = {"role": "assistant", "content": content}
+        if tool_calls:
+            msg_dict["tool_calls"] = tool_calls
+        return content, tool_calls, msg_dict
+
+    async def _generate_walkthrough_summary(self, session_id: str, active_callbacks: dict, stream: bool = False, session: AgentSession = None) -> str:
         """Helper to generate the final walkthrough using the LLM itself."""
         if not self.execution_log:
             return ""
@@ -1217,7 +1488,8 @@ class Agent:
             f"Execution Records:\n{execution_records}"
         )
         
-        session = self.get_session(session_id)
+        if session is None:
+            session = self.get_session(session_id)
         session.add_message({"role": "user", "content": walkthrough_prompt})
         
         try:
@@ -1234,7 +1506,6 @@ class Agent:
             else:
                  response = await self.gateway.chat(session.messages, tools=None)
             
-            from logicore.providers.gateway import NormalizedMessage
             if isinstance(response, NormalizedMessage):
                 content = response.content
             else:
@@ -1259,19 +1530,34 @@ class Agent:
         if self.auto_approve_all:
             return False
         
-        # 1. Allow Safe Tools Explicitly
-        if name in SAFE_TOOLS:
-            return False
-            
-        # Exempt 'computer' tool calls from approval (Claude Computer Use)
-        if name == 'computer':
+        # 1. Allow Safe Tools (and 'computer') Explicitly
+        if name in _APPROVAL_EXEMPT_TOOLS:
             return False
 
         # 2. Everything else requires approval
         # This covers DANGEROUS_TOOLS, APPROVAL_REQUIRED_TOOLS, and any unknown MCP/Custom tools
         return True
 
+    async def _execute_approved(self, calls: List[tuple], session_id: str) -> List[Any]:
+        """Run approved (name, args) calls, returning results (or exceptions) in call order.
 
+        Runs of adjacent read-only tools are gathered concurrently; any other
+        tool runs on its own, after everything before it, so a write the
+        model issued ahead of a dependent call has landed when that call runs.
+        """
+        results: List[Any] = []
+        i = 0
+        while i < len(calls):
+            j = i + 1
+            if calls[i][0] in _READ_ONLY_TOOLS:
+                while j < len(calls) and calls[j][0] in _READ_ONLY_TOOLS:
+                    j += 1
+            results.extend(await asyncio.gather(
+                *(self._execute_tool(name, args, session_id) for name, args in calls[i:j]),
+                return_exceptions=True,
+            ))
+            i = j
+        return results
 
     async def _execute_tool(self, name: str, args: Dict, session_id: str) -> Any:
         # Logging Tool Execution
@@ -1281,13 +1567,14 @@ class Agent:
         result = None
         
         try:
-            # 1. Custom Tools
+            # 1. Custom Tools (sync executors run in a worker thread so a
+            #    blocking user function doesn't stall the event loop)
             if name in self.custom_tool_executors:
                 executor = self.custom_tool_executors[name]
                 if inspect.iscoroutinefunction(executor):
                     result = await executor(**args)
                 else:
-                    result = executor(**args)
+                    result = await asyncio.to_thread(executor, **args)
             
             # 1b. Skill Tools
             elif name in self.skill_tool_executors:
@@ -1295,25 +1582,23 @@ class Agent:
                 if inspect.iscoroutinefunction(executor):
                     result = await executor(**args)
                 else:
-                    result = executor(**args)
+                    result = await asyncio.to_thread(executor, **args)
             
             # 2. MCP Tools
-            elif any(name in manager.server_tools_map for manager in self.mcp_managers):
-                 for manager in self.mcp_managers:
-                    if name in manager.server_tools_map:
-                        try:
-                            result = await manager.execute_tool(name, args)
-                            break
-                        except Exception as e:
-                            logger.error(f"Tool Error (MCP): {name} | Error: {e}")
-                            return {"error": str(e)}
+            elif name in self._mcp_tool_index:
+                try:
+                    result = await self._mcp_tool_index[name].execute_tool(name, args)
+                except Exception as e:
+                    logger.error(f"Tool Error (MCP): {name} | Error: {e}")
+                    return {"error": str(e)}
                             
-            # 3. Internal Default Tools
+            # 3. Internal Default Tools (blocking file/network/subprocess work;
+            #    run in a worker thread so streaming and other sessions keep going)
             else:
-                result = execute_tool(name, args)
+                result = await asyncio.to_thread(execute_tool, name, args)
 
             duration = (datetime.now() - start_time).total_seconds()
-            logger.info(f"Tool Execution End: {name} | Duration: {duration:.4f}s | Result: {str(result)[:200]}...") # Truncate result for logs
+            logger.info(f"Tool Execution End: {name} | Duration: {duration:.4f}s | Result: {_preview(result)}...") # Truncate result for logs
             return result
 
         except Exception as e:
@@ -1345,10 +1630,17 @@ class Agent:
             return None
         return json.dumps({"log": self.execution_log}, indent=2)
 
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb):
+        await self.cleanup()
+
     async def cleanup(self):
         """Clean up resources."""
         for manager in self.mcp_managers:
             await manager.cleanup()
+        self._mcp_tool_index = {}
 
         # Flush any unprocessed memories to vector store on teardown
         if self.memory_enabled and self.simplemem:
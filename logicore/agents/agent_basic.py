@@ -43,6 +43,7 @@ from pydantic import BaseModel, Field, create_model
 from logicore.providers.base import LLMProvider
 from logicore.agents.agent import Agent
 from logicore.tools.base import BaseTool, ToolResult
+from logicore.utils.docstrings import GOOGLE_ARG_RE, SPHINX_PARAM_RE
 
 
 class BasicAgent:
@@ -236,7 +237,6 @@ You are ready to help. Use your tools effectively.
     
     def register_tool_from_function(self, func: Callable):
         """Convert a Python function to a tool and register it with docstring-parsed param descriptions."""
-        import re
         
         name = func.__name__
         raw_doc = func.__doc__ or f"Execute {name}"
@@ -249,7 +249,7 @@ You are ready to help. Use your tools effectively.
         
         for line in doc_lines:
             stripped = line.strip()
-            sphinx = re.match(r':param\s+(\w+)\s*:(.*)', stripped)
+            sphinx = SPHINX_PARAM_RE.match(stripped)
             if sphinx:
                 param_docs[sphinx.group(1)] = sphinx.group(2).strip()
                 continue
@@ -260,7 +260,7 @@ You are ready to help. Use your tools effectively.
                 in_args = False
                 continue
             if in_args and stripped:
-                arg_match = re.match(r'(\w+)\s*(?:\([^)]*\))?\s*:(.*)', stripped)
+                arg_match = GOOGLE_ARG_RE.match(stripped)
                 if arg_match:
                     param_docs[arg_match.group(1)] = arg_match.group(2).strip()
                 continue
@@ -409,7 +409,8 @@ You are ready to help. Use your tools effectively.
         Returns:
             List of tool schemas with function definition and parameters
         """
-        return await self._agent.get_all_tools()
+        # Copy: the agent hands out its cached list
+        return list(await self._agent.get_all_tools())
     
     def clear_history(self, session_id: str = "default"):
         """Clear conversation history for a session."""
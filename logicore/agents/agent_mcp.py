@@ -660,12 +660,13 @@ class MCPAgent(Agent):
     
     def get_session_history(self, session_id: str) -> Optional[List[Dict[str, Any]]]:
         """Get the full message history for a session."""
-        session = self.get_session(session_id)
+        # Plain lookup: reading history must not create an empty session
+        session = self.sessions.get(session_id)
         return session.messages if session else None
     
     def clear_session_history(self, session_id: str, keep_system: bool = True) -> bool:
         """Clear the conversation history for a session."""
-        session = self.get_session(session_id)
+        session = self.sessions.get(session_id)
         if session:
             session.clear_history(keep_system)
             return True
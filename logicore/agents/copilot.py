@@ -26,7 +26,8 @@ class CopilotAgent(Agent):
         telemetry: bool = False,
         memory: bool = False,
         skills: list = None,
-        workspace_root: str = None
+        workspace_root: str = None,
+        max_history_messages: int = None
     ):
         # Use copilot-specific prompt if no custom message provided
         if not system_message:
@@ -45,7 +46,8 @@ class CopilotAgent(Agent):
             telemetry=telemetry,
             memory=memory,
             skills=skills,
-            workspace_root=workspace_root
+            workspace_root=workspace_root,
+            max_history_messages=max_history_messages
         )
         
         # Auto-load tools useful for coding
@@ -112,6 +114,8 @@ class CopilotAgent(Agent):
             # Create session with General Agent prompt
             model_name = getattr(self.provider, "model_name", "Unknown")
             prompt = get_system_prompt(model_name, role="general")
-            self.sessions[session_id] = AgentSession(session_id, prompt)
+            self.sessions[session_id] = AgentSession(
+                session_id, prompt, max_history_messages=self.max_history_messages
+            )
             
         return await self.chat(user_input, session_id=session_id, stream=stream)
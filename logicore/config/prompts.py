@@ -9,8 +9,24 @@ This file contains system prompts for each agent type:
 Tools are passed dynamically - either at agent initialization or registered later.
 """
 
+import functools
 import os
-from datetime import datetime
+import string
+import time
+
+__all__ = [
+    "get_system_prompt",
+    "get_system_prompt_static",
+    "get_system_prompt_footer",
+    "get_system_prompt_bytes",
+    "preload_prompts",
+    "get_copilot_prompt",
+    "get_engineer_prompt",
+    "get_mcp_prompt",
+    "get_smart_agent_solo_prompt",
+    "get_smart_agent_project_prompt",
+    "invalidate_cwd",
+]
 
 
 def _format_tools(tools: list = []) -> str:
@@ -73,28 +89,23 @@ def _format_tools(tools: list = []) -> str:
     return f"\n<available_tools>\n{tools_str}\n</available_tools>"
 
 
-def get_system_prompt(model_name: str = "Unknown Model", role: str = "general", tools: list = []) -> str:
-    """
-    Generates the system prompt for the AI agent.
-    
-    Args:
-        model_name (str): The name of the model being used.
-        role (str): The role of the agent ('general', 'engineer', or 'copilot').
-        tools (list): List of available tools (empty list by default, can be extended).
-        
-    Returns:
-        str: The formatted system prompt.
-    """
-    
-    current_time = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-    cwd = os.getcwd()
-    tools_section = _format_tools(tools)
-    
-    if role == "mcp":
-        return get_mcp_prompt(model_name)
-    
-    elif role == "engineer":
-        return f"""You are an AI Software Engineer from the Logicore team. You are powered by {model_name}.
+# Role prompts are assembled from the fragments below; sections shared by
+# several roles (such as <context>) are stored once. Only model_name,
+# tools_section, current_time and cwd vary between calls, so each composed
+# prompt is split into its literal chunks once (on first use of the role) and
+# rendered by joining those chunks with the per-call values.
+
+_FRAGMENTS = {
+    "context": """
+
+You are powered by {model_name}.
+
+<context>
+- Time: {current_time}
+- Working directory: {cwd}
+- Model: {model_name}
+</context>""",
+    "engineer": """You are an AI Software Engineer from the Logicore team.
 
 <identity>
 You are a senior software engineer with deep expertise across multiple languages, frameworks, and architectures. You write production-quality code that is clean, efficient, testable, and maintainable.
@@ -126,16 +137,9 @@ Core traits:
 7. Report findings with evidence (actual code snippets, structure analysis)
 </workflow>
 
-<context>
-- Time: {current_time}
-- Working directory: {cwd}
-- Model: {model_name}
-</context>
-
-Your purpose is to take action. Be direct and implement solutions, not just explain them."""
-
-    elif role == "copilot":
-        return f"""You are Agentry Copilot, an expert AI coding assistant. You are powered by {model_name}.
+""",
+    "engineer_closing": "Your purpose is to take action. Be direct and implement solutions, not just explain them.",
+    "copilot": """You are Agentry Copilot, an expert AI coding assistant.
 
 <identity>
 You are a brilliant programmer who can write, explain, review, and debug code in any language. You think like a senior developer but explain like a patient teacher.
@@ -167,16 +171,9 @@ You excel at:
 7. Be Evidence-Based - reference actual code patterns and implementations from the codebase
 </guidelines>
 
-<context>
-- Time: {current_time}
-- Working directory: {cwd}
-- Model: {model_name}
-</context>
-
-Help users write better code and become better developers."""
-
-    else:  # General Agent
-        return f"""You are an AI Assistant from the Agentry Framework. You are powered by {model_name}.
+""",
+    "copilot_closing": "Help users write better code and become better developers.",
+    "general": """You are an AI Assistant from the Agentry Framework.
 
 <identity>
 You are a versatile AI assistant designed to help with a wide range of tasks. You combine strong reasoning with practical tool access and thoughtful analysis.
@@ -209,32 +206,9 @@ one well-planned tool call beats three exploratory ones
 6. Be Visual - provide diagrams, examples, and clear explanations based on what you found
 </guidelines>
 
-<context>
-- Time: {current_time}
-- Working directory: {cwd}
-- Model: {model_name}
-</context>
-
-You are ready to help. Respond thoughtfully and take action when appropriate.
-"""
-
-
-def get_copilot_prompt(model_name: str = "Unknown Model") -> str:
-    """Get the Copilot-specific system prompt."""
-    return get_system_prompt(model_name, role="copilot")
-
-
-def get_engineer_prompt(model_name: str = "Unknown Model") -> str:
-    """Get the Engineer-specific system prompt."""
-    return get_system_prompt(model_name, role="engineer")
-
-
-def get_mcp_prompt(model_name: str = "Unknown Model") -> str:
-    """Get the MCP-specific system prompt with dynamic tool discovery."""
-    current_time = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-    cwd = os.getcwd()
-    
-    return f"""You are an AI Agent with access to Dynamic Tool Discovery. You are powered by {model_name}.
+""",
+    "general_closing": "You are ready to help. Respond thoughtfully and take action when appropriate.",
+    "mcp": """You are an AI Agent with access to Dynamic Tool Discovery.
 
 <identity>
 You are a capable AI agent that can accomplish a wide range of tasks by intelligently discovering and using the right tools for each job. You have access to MCP (Model Context Protocol) servers that provide on-demand tools.
@@ -309,44 +283,220 @@ You can accomplish tasks involving:
 6. Never Say "I Can't" - instead say "Let me search for the right tools"
 </guidelines>
 
-<context>
-- Time: {current_time}
-- Working directory: {cwd}
-- Model: {model_name}
-</context>
+""",
+    "mcp_closing": "You are ready to help. Search for tools, discover solutions, and take action.",
+}
+
+# Fragment keys making up each role's prompt, in order: the static body
+# followed by the per-call footer. Everything that changes between calls
+# (model, time, cwd) is kept in the footer so the body is a stable prefix
+# that provider-side prompt caching can reuse.
+_ROLE_RECIPES = {
+    "engineer": (("engineer", "engineer_closing"), ("context",)),
+    "copilot": (("copilot", "copilot_closing"), ("context",)),
+    "general": (("general", "general_closing"), ("context",)),
+    "mcp": (("mcp", "mcp_closing"), ("context",)),
+}
+
+
+def _split_template(template: str) -> tuple:
+    """Pre-split a ``str.format`` template into ``(literal, field_name)`` pairs."""
+    return tuple(
+        (literal, field_name)
+        for literal, field_name, _, _ in string.Formatter().parse(template)
+    )
+
+
+def _render(parts: tuple, values: dict) -> str:
+    """Join pre-split template parts with their values (str()-ed, as format would)."""
+    chunks = []
+    for literal, field_name in parts:
+        chunks.append(literal)
+        if field_name is not None:
+            chunks.append(str(values[field_name]))
+    return "".join(chunks)
+
+
+def _bind(parts: tuple, values: dict) -> tuple:
+    """
+    Fill the fields of pre-split template parts that appear in ``values``,
+    returning the parts still to be rendered with the remaining fields.
+    """
+    bound = []
+    pending = []
+    for literal, field_name in parts:
+        pending.append(literal)
+        if field_name is None:
+            continue
+        if field_name in values:
+            pending.append(str(values[field_name]))
+        else:
+            bound.append(("".join(pending), field_name))
+            pending = []
+    bound.append(("".join(pending), None))
+    return tuple(bound)
 
-You are ready to help. Search for tools, discover solutions, and take action."""
 
+def _compose(recipe: tuple) -> str:
+    """Assemble a prompt template from its fragment keys."""
+    return "".join(_FRAGMENTS[key] for key in recipe)
 
-# SmartAgent Prompts - Dynamic with Tools Integration
 
-def get_smart_agent_solo_prompt(model_name: str = "Unknown Model", tools: list = None) -> str:
+@functools.lru_cache(maxsize=None)
+def _role_parts(role: str) -> tuple:
     """
-    Get the system prompt for SmartAgent in solo chat mode.
+    Split a role's recipe into (body_parts, footer_parts) on first use.
     
-    Solo mode is optimized for general reasoning with real-time awareness.
-    Tools are injected dynamically.
+    A process normally runs a single role, so the other templates are never
+    composed or parsed.
+    """
+    body, footer = _ROLE_RECIPES[role]
+    return _split_template(_compose(body)), _split_template(_compose(footer))
+
+
+@functools.lru_cache(maxsize=32)
+def _static_prompt(role: str, tools_section: str) -> str:
+    """Render (and memoize) the part of a role prompt that has no model, time or cwd."""
+    return _render(_role_parts(role)[0], {"tools_section": tools_section})
+
+
+def _dynamic_footer(role: str, model_name: str, current_time: str, cwd: str) -> str:
+    """Render the per-call tail of a role prompt (model line and <context> block)."""
+    return _render(_role_parts(role)[1], {
+        "model_name": model_name,
+        "current_time": current_time,
+        "cwd": cwd,
+    })
+
+
+# Last rendered "%Y-%m-%d %H:%M:%S" timestamp and the epoch second it is for;
+# prompts built within the same second reuse the string.
+_last_ts_sec = -1
+_last_ts_str = ""
+
+
+def _timestamp() -> str:
+    """Return the current local time as "%Y-%m-%d %H:%M:%S", formatted at most once a second."""
+    global _last_ts_sec, _last_ts_str
+    now = int(time.time())
+    if now != _last_ts_sec:
+        _last_ts_str = time.strftime("%Y-%m-%d %H:%M:%S", time.localtime(now))
+        _last_ts_sec = now
+    return _last_ts_str
+
+
+# Working directory reported in prompts, read once; see invalidate_cwd()
+_cwd_cache = None
+
+
+def _cwd() -> str:
+    """Return the process working directory, cached after the first call."""
+    global _cwd_cache
+    if _cwd_cache is None:
+        _cwd_cache = os.getcwd()
+    return _cwd_cache
+
+
+def invalidate_cwd() -> None:
+    """Forget the cached working directory. Call after ``os.chdir``."""
+    global _cwd_cache
+    _cwd_cache = None
+
+
+@functools.lru_cache(maxsize=16)
+def _full_prompt(role: str, tools_section: str, model_name: str, current_time: str, cwd: str) -> str:
+    """
+    Complete role prompt. The timestamp is part of the key, so this only
+    serves calls within the same second, such as the rebuild Agent runs after
+    each tool registration, and they all get the same string object back.
+    """
+    return _static_prompt(role, tools_section) + _dynamic_footer(role, model_name, current_time, cwd)
+
+
+def _resolve_role(role: str) -> str:
+    """Map unknown roles onto the general agent."""
+    return role if role in _ROLE_RECIPES else "general"
+
+
+def get_system_prompt(model_name: str = "Unknown Model", role: str = "general", tools: list = []) -> str:
+    """
+    Generates the system prompt for the AI agent.
+    
+    The result is ``get_system_prompt_static(role, tools)`` followed by
+    ``get_system_prompt_footer(model_name, role)``.
     
     Args:
-        model_name: The name of the LLM model being used
-        tools: List of tool schemas to include in the prompt
+        model_name (str): The name of the model being used.
+        role (str): The role of the agent ('general', 'engineer', 'copilot', or 'mcp').
+            Unknown roles fall back to 'general'.
+        tools (list): List of available tools (empty list by default, can be extended).
         
     Returns:
-        Formatted system prompt for solo mode
+        str: The formatted system prompt.
+    """
+    return _full_prompt(_resolve_role(role), _format_tools(tools), model_name, _timestamp(), _cwd())
+
+
+def get_system_prompt_static(role: str = "general", tools: list = []) -> str:
+    """
+    The stable leading part of a role prompt: identical across calls for the
+    same role and tools, so it can be sent as a provider-cached block.
+    """
+    return _static_prompt(_resolve_role(role), _format_tools(tools))
+
+
+def get_system_prompt_footer(model_name: str = "Unknown Model", role: str = "general") -> str:
+    """The per-call tail of a role prompt: model line plus the <context> block."""
+    return _dynamic_footer(_resolve_role(role), model_name, _timestamp(), _cwd())
+
+
+@functools.lru_cache(maxsize=32)
+def _static_prompt_bytes(role: str, tools_section: str) -> bytes:
+    return _static_prompt(role, tools_section).encode("utf-8")
+
+
+def get_system_prompt_bytes(model_name: str = "Unknown Model", role: str = "general", tools: list = []) -> bytes:
+    """
+    UTF-8 encoded ``get_system_prompt(...)`` for callers that write the prompt
+    straight into a request body. The encoded static body is memoized, so only
+    the short per-call footer is encoded each time.
+    """
+    role = _resolve_role(role)
+    footer = _dynamic_footer(role, model_name, _timestamp(), _cwd())
+    return _static_prompt_bytes(role, _format_tools(tools)) + footer.encode("utf-8")
+
+
+def preload_prompts(roles=None, tools: list = []) -> None:
+    """
+    Render and encode the static bodies for ``roles`` (all roles by default)
+    up front, e.g. at startup or before forking workers, so later calls only
+    build the footer.
     """
-    if tools is None:
-        tools = []
-    
-    current_time = datetime.now()
     tools_section = _format_tools(tools)
-    
-    return f"""You are SmartAgent, an AI assistant created by the Agentry team. You are powered by {model_name}.
+    for role in roles or _ROLE_RECIPES:
+        _static_prompt_bytes(_resolve_role(role), tools_section)
+
+
+# Role shortcuts; partials skip the extra Python frame a wrapper def would add
+get_copilot_prompt = functools.partial(get_system_prompt, role="copilot")
+get_engineer_prompt = functools.partial(get_system_prompt, role="engineer")
+get_mcp_prompt = functools.partial(get_system_prompt, role="mcp")
+
+
+# SmartAgent Prompts - Dynamic with Tools Integration
+#
+# Like the role prompts, these are module templates split into literal chunks
+# once and rendered by joining the chunks with the per-call values. The model
+# name, time and cwd appear only in the closing <current_context> block, so
+# everything before it is a stable prefix for provider-side prompt caching.
+
+_SMART_SOLO_TEMPLATE = """You are SmartAgent, an AI assistant created by the Agentry team.
 
 <knowledge_cutoff>
 Your training data has a knowledge cutoff. For current information, recent events, or time-sensitive queries:
-- **ALWAYS use web_search** when the query involves: recent events, current news, breaking news, live data, today's date, this year's events, 2026 updates, latest trends, prices, rankings, weather, sports scores, or anything marked "recent", "now", "today", "latest"
+- **ALWAYS use web_search** for time-sensitive queries (recent events, news, live data, prices, rankings, weather, scores, anything "recent", "now", "today", "latest") — see <web_search_intelligence>
 - Do NOT rely on training knowledge for time-sensitive queries
-- Current real-time reference: {current_time.strftime("%A, %B %d, %Y at %H:%M:%S UTC")}
+- Current real-time reference: see <current_context> at the end of this prompt
 - Your knowledge effectively updates in real-time through smart web_search usage
 </knowledge_cutoff>
 
@@ -421,26 +571,15 @@ Your core traits:
 - Timeless knowledge: "Why is the sky blue?", "How does photosynthesis work?"
 - Personal user data from memory (name, preferences, settings) — trust it, never search for it
 
-**When Memory Has Context — The Verify vs. Trust Split:**
-If retrieved memory contains information relevant to the query, classify it first:
-- **Personal data** (user name, preference, stated fact about themselves) → use directly, DO NOT search
-- **Factual/event/research data** (match scores, study results, news, version numbers, stats) → use as context, but run ONE focused freshness check: `[topic] update 2026` or `[topic] latest March 2026`
-- Keep the verification search NARROW — just confirm if anything changed, don't re-research from scratch
-- If web result matches memory → answer confidently, confirm with both sources
-- If web result contradicts memory → use the newer web result, briefly note the discrepancy
+**When Memory Has Context:** classify it per <memory_verification_policy>. Keep any verification search NARROW — just confirm if anything changed. If the web result contradicts memory, use the newer web result and briefly note the discrepancy.
 
 **Example Decision Tree:**
 - "What's the weather today?" → SEARCH (time-dependent)
 - "How do clouds form?" → NO search (timeless knowledge)
 - "Who won the 2026 World Cup?" → SEARCH (current event)
-- "How do sports tournaments work?" → NO search (general knowledge)
 - "What's new in Python?" → SEARCH (current/recent)
 - "What is Python?" → NO search (timeless)
-- "Latest news about AI?" → SEARCH (time-sensitive)
-- "Explain machine learning" → NO search (general knowledge)
-- Memory has `user name: Rudra`, user asks anything → use Rudra, NO search
 - Memory has `study: X drug effective (2023)`, user asks about it today → VERIFY with search
-- Memory has `India won IPL 2025` → still SEARCH for 2026 updates before answering
 </web_search_intelligence>
 
 <tool_usage_guidelines>
@@ -457,19 +596,13 @@ When presented with a task or question:
 
 1. **Parse the request**: What is the user asking? Is it time-sensitive? Does it involve facts, events, research, or personal data?
 
-2. **Classify any retrieved memory context** (if memory was injected):
-   - Is this **personal user data** (name, preference, personal setting they told you)? → Trust it, use directly, skip search completely
-   - Is this **factual / event / research content** (scores, study results, news, version numbers, rankings)? → Use as context, but do ONE focused verification search: `[topic] update 2026`
-   - No relevant memory? → Move to step 3
+2. **Classify any retrieved memory context** per <memory_verification_policy>: personal data → use directly; factual / event / research content → ONE focused verification search. No relevant memory? → Move to step 3
 
 3. **Check if current info needed**: Does this involve recent events, current data, today's date, or "now"?
    - YES → use web_search (see web_search_intelligence for smart usage)
    - NO → proceed with training knowledge
 
-4. **Assess your knowledge**: Can you answer directly from training, or need tools?
-   - Confident in timeless knowledge → respond directly
-   - Needs current info → use web_search with specific query
-   - System operation → use bash
+4. **Assess your knowledge**: Timeless knowledge → respond directly; system operation → use bash
 
 5. **Consider scope**: Is this simple or complex?
    - Simple → direct, concise answer
@@ -509,16 +642,18 @@ When presented with a task or question:
 <current_awareness>
 **Stay tuned to the world — proactively surface what's relevant right now:**
 
-- Today is {current_time.strftime("%A, %B %d, %Y")}. You are operating in real-time, not from a frozen snapshot.
+- Today's date is in <current_context> below. You are operating in real-time, not from a frozen snapshot.
 - When a topic the user asks about is trending, in the news, or has had recent major developments — mention it proactively if it meaningfully changes or enriches the answer.
-- For viral topics, breaking news, or anything that could have shifted in the last few weeks: always web_search before answering — your training does not capture what went viral yesterday.
+- For viral topics, breaking news, or anything that could have shifted in the last few weeks: always web_search before answering.
 - If the user asks about a public figure, company, technology, or current event — consider whether a recent development makes the answer materially different, and if so, surface it.
 - Don't force it — only bring in current context when it actually adds value to the response.
 </current_awareness>
 
 <current_context>
-- Current time: {current_time.strftime("%A, %B %d, %Y at %H:%M:%S UTC")}
-- Working directory: {__import__('os').getcwd()}
+- Model: {model_name}
+- Current time: {current_time}
+- Today: {today}
+- Working directory: {cwd}
 - Session: Active
 - Time-awareness: Enabled
 - Memory classification: Active (personal data trusted directly; facts/events/research verified via web)
@@ -528,55 +663,36 @@ You are ready to help. Respond thoughtfully, accurately, and with real-time awar
 """
 
 
-def get_smart_agent_project_prompt(model_name: str = "Unknown Model", project_context: dict = None, tools: list = None) -> str:
+def get_smart_agent_solo_prompt(model_name: str = "Unknown Model", tools: list = None) -> str:
     """
-    Get the system prompt for SmartAgent in project mode.
+    Get the system prompt for SmartAgent in solo chat mode.
     
-    Project mode is context-aware and optimized for project-based work with memory integration.
+    Solo mode is optimized for general reasoning with real-time awareness.
     Tools are injected dynamically.
     
     Args:
         model_name: The name of the LLM model being used
-        project_context: Dictionary with keys: title, goal, environment, key_files, current_focus, project_id
         tools: List of tool schemas to include in the prompt
         
     Returns:
-        Formatted system prompt for project mode
+        Formatted system prompt for solo mode
     """
     if tools is None:
         tools = []
     
-    if project_context is None:
-        project_context = {}
-    
-    project_title = project_context.get("title", "Unnamed Project")
-    project_goal = project_context.get("goal", "No goal specified")
-    project_id = project_context.get("project_id", "default")
-    
-    current_time = datetime.now()
+    current_time = time.localtime()
     tools_section = _format_tools(tools)
     
-    # Build environment section
-    env_section = ""
-    environment = project_context.get("environment", {})
-    if environment:
-        env_items = "\n".join([f"  - {k}: {v}" for k, v in environment.items()])
-        env_section = f"\nEnvironment:\n{env_items}"
-    
-    # Build files section
-    files_section = ""
-    key_files = project_context.get("key_files", [])
-    if key_files:
-        files_items = "\n".join([f"  - {f}" for f in key_files])
-        files_section = f"\nKey Files:\n{files_items}"
-    
-    # Build focus section
-    focus_section = ""
-    current_focus = project_context.get("current_focus")
-    if current_focus:
-        focus_section = f"\nCurrent Focus: {current_focus}"
-    
-    return f"""You are SmartAgent, an AI assistant created by the Agentry team, operating in Project Mode. You are powered by {model_name}.
+    return _render(_smart_parts("solo"), {
+        "model_name": str(model_name),
+        "tools_section": tools_section,
+        "current_time": time.strftime("%A, %B %d, %Y at %H:%M:%S UTC", current_time),
+        "today": time.strftime("%A, %B %d, %Y", current_time),
+        "cwd": _cwd(),
+    })
+
+
+_SMART_PROJECT_TEMPLATE = """You are SmartAgent, an AI assistant created by the Agentry team, operating in Project Mode.
 
 <project_context>
 Project: {project_title}
@@ -587,7 +703,7 @@ Goal: {project_goal}{env_section}{files_section}{focus_section}
 Your training data has a knowledge cutoff. For project-related current information (new tool versions, library updates, framework changes, latest best practices):
 - **Use web_search for:** latest versions, 2026 updates, current best practices, recent breaking changes, latest documentation, current benchmarks
 - **Do NOT rely on outdated knowledge** for: tool versions, library features, framework changes, security updates
-- **Current time reference:** {current_time.strftime("%A, %B %d, %Y at %H:%M:%S UTC")}
+- **Current time reference:** see <current_context> at the end of this prompt
 - **Keep project knowledge current** through smart web_search to ensure recommendations are accurate
 </knowledge_cutoff>
 
@@ -717,15 +833,17 @@ Before tackling challenges:
 <current_awareness>
 **Stay current on project-relevant world changes:**
 
-- Today is {current_time.strftime("%A, %B %d, %Y")}. Technology evolves fast — what was best practice last month may already have a better alternative.
+- Today's date is in <current_context> below. Technology evolves fast — what was best practice last month may already have a better alternative.
 - If any technology, library, or service this project uses has had a recent major update, security issue, or deprecation — surface it proactively when relevant to the task.
 - For ecosystem-level shifts (major framework release, breaking API change, newly emerged alternative) that could affect this project's direction: mention it even if not directly asked, if it's consequential.
 - Keep it project-scoped — don't surface unrelated world news; focus on the tech domain and goals of this specific project.
 </current_awareness>
 
 <current_context>
-- Current time: {current_time.strftime("%A, %B %d, %Y at %H:%M:%S UTC")}
-- Working directory: {__import__('os').getcwd()}
+- Model: {model_name}
+- Current time: {current_time}
+- Today: {today}
+- Working directory: {cwd}
 - Project: {project_title} ({project_id})
 - Mode: Project-focused with real-time awareness
 - Memory classification: Active (project decisions trusted; external version/fact memories verified)
@@ -733,4 +851,95 @@ Before tackling challenges:
 </current_context>
 
 You are ready to help with {project_title}. Focus on project goals, trust internal project memory, verify external facts from memory, and stay current with 2026 technology developments.
-"""
\ No newline at end of file
+"""
+
+
+@functools.lru_cache(maxsize=None)
+def _smart_parts(mode: str) -> tuple:
+    """Pre-split SmartAgent template for ``mode`` ('solo' or 'project'), on first use."""
+    return _split_template(_SMART_SOLO_TEMPLATE if mode == "solo" else _SMART_PROJECT_TEMPLATE)
+
+
+@functools.lru_cache(maxsize=32)
+def _project_parts(
+    model_name: str,
+    project_title: str,
+    project_goal: str,
+    project_id: str,
+    env_section: str,
+    files_section: str,
+    focus_section: str,
+    tools_section: str,
+) -> tuple:
+    """
+    Project template with everything but the time and cwd filled in.
+    
+    Keyed on the rendered sections rather than the project_context dict, so
+    a changed project simply misses the cache.
+    """
+    return _bind(_smart_parts("project"), {
+        "model_name": model_name,
+        "project_title": project_title,
+        "project_goal": project_goal,
+        "project_id": project_id,
+        "env_section": env_section,
+        "files_section": files_section,
+        "focus_section": focus_section,
+        "tools_section": tools_section,
+    })
+
+
+def get_smart_agent_project_prompt(model_name: str = "Unknown Model", project_context: dict = None, tools: list = None) -> str:
+    """
+    Get the system prompt for SmartAgent in project mode.
+    
+    Project mode is context-aware and optimized for project-based work with memory integration.
+    Tools are injected dynamically.
+    
+    Args:
+        model_name: The name of the LLM model being used
+        project_context: Dictionary with keys: title, goal, environment, key_files, current_focus, project_id
+        tools: List of tool schemas to include in the prompt
+        
+    Returns:
+        Formatted system prompt for project mode
+    """
+    if tools is None:
+        tools = []
+    
+    if project_context is None:
+        project_context = {}
+    
+    project_title = project_context.get("title", "Unnamed Project")
+    project_goal = project_context.get("goal", "No goal specified")
+    project_id = project_context.get("project_id", "default")
+    
+    current_time = time.localtime()
+    tools_section = _format_tools(tools)
+    
+    # Optional sections: one lookup per key, and no throwaway {} / [] defaults
+    environment = project_context.get("environment")
+    key_files = project_context.get("key_files")
+    current_focus = project_context.get("current_focus")
+    
+    env_section = ""
+    if environment:
+        env_items = "\n".join([f"  - {k}: {v}" for k, v in environment.items()])
+        env_section = f"\nEnvironment:\n{env_items}"
+    
+    files_section = ""
+    if key_files:
+        files_items = "\n".join([f"  - {f}" for f in key_files])
+        files_section = f"\nKey Files:\n{files_items}"
+    
+    focus_section = f"\nCurrent Focus: {current_focus}" if current_focus else ""
+    
+    parts = _project_parts(
+        str(model_name), str(project_title), str(project_goal), str(project_id),
+        env_section, files_section, focus_section, tools_section,
+    )
+    return _render(parts, {
+        "current_time": time.strftime("%A, %B %d, %Y at %H:%M:%S UTC", current_time),
+        "today": time.strftime("%A, %B %d, %Y", current_time),
+        "cwd": _cwd(),
+    })
@@ -1,13 +1,29 @@
-from .base import BaseDocumentHandler
+from .base import BaseDocumentHandler, BinaryFileError
 from .registry import get_handler, DocumentHandlerRegistry
-from .pdf import PDFHandler
-from .docx import DocxHandler
-from .pptx import PPTXHandler
-from .excel import ExcelHandler
-from .text import TextHandler
+
+# Handler classes are imported on first attribute access (PEP 562), matching
+# the registry's lazy loading.
+_LAZY_HANDLERS = {
+    "PDFHandler": ".pdf",
+    "DocxHandler": ".docx",
+    "PPTXHandler": ".pptx",
+    "ExcelHandler": ".excel",
+    "TextHandler": ".text",
+}
+
+
+def __getattr__(name):
+    module_name = _LAZY_HANDLERS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    import importlib
+    value = getattr(importlib.import_module(module_name, __name__), name)
+    globals()[name] = value
+    return value
 
 __all__ = [
     "BaseDocumentHandler",
+    "BinaryFileError",
     "get_handler",
     "DocumentHandlerRegistry",
     "PDFHandler",
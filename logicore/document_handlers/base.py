@@ -1,6 +1,37 @@
 from abc import ABC, abstractmethod
 from typing import Dict, Any, Optional
 import os
+import re
+
+def str_or_none(value: Any) -> Optional[str]:
+    """``str(value)``, except that None stays None (rather than becoming "None")."""
+    return None if value is None else str(value)
+
+class BinaryFileError(RuntimeError):
+    """Raised when a file with no registered handler is binary rather than text."""
+
+_MIDNIGHT = re.compile(r"^(\d{4}-\d{2}-\d{2}) 00:00:00(?:\+00:00)?$")
+
+def compact_metadata(metadata: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Drop metadata that adds nothing when rendered into a prompt: None and
+    empty-string values, ``last_modified_by`` equal to ``author``,
+    ``modified`` equal to ``created``, and a midnight time-of-day on dates.
+    """
+    compact = {}
+    for key, value in metadata.items():
+        if value is None or value == "":
+            continue
+        if isinstance(value, str):
+            match = _MIDNIGHT.match(value)
+            if match:
+                value = match.group(1)
+        compact[key] = value
+    if "last_modified_by" in compact and compact.get("last_modified_by") == compact.get("author"):
+        del compact["last_modified_by"]
+    if "modified" in compact and compact.get("modified") == compact.get("created"):
+        del compact["modified"]
+    return compact
 
 class BaseDocumentHandler(ABC):
     """
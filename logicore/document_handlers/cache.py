@@ -0,0 +1,150 @@
+import functools
+import hashlib
+import importlib.util
+import json
+import os
+import time
+from typing import Optional
+
+# Extracted text is cached under LOGICORE_DOC_CACHE_DIR (default
+# ~/.cache/logicore/doc_text); set LOGICORE_DOC_CACHE=0 to turn it off. Bump
+# _CACHE_VERSION whenever a handler changes what it extracts.
+_CACHE_VERSION = 4
+
+# Entries hold text copied out of the user's documents, so the cache is
+# private to the user and bounded in age and total size.
+_DIR_MODE = 0o700
+_FILE_MODE = 0o600
+MAX_CACHE_AGE_DAYS = float(os.getenv("LOGICORE_DOC_CACHE_MAX_AGE_DAYS", "30"))
+MAX_CACHE_MB = float(os.getenv("LOGICORE_DOC_CACHE_MAX_MB", "256"))
+
+# OllamaVisionService reports errors (including a missing ollama library)
+# as text with this prefix rather than raising
+_OCR_FAILURE_PREFIX = "[Ollama Vision Failed"
+
+def is_ocr_failure(text: str) -> bool:
+    """Whether an OllamaVisionService result is an error report rather than text."""
+    return text.startswith(_OCR_FAILURE_PREFIX)
+
+@functools.lru_cache(maxsize=None)
+def _vision_installed() -> bool:
+    """Whether the OCR fallback's libraries are importable at all."""
+    return all(importlib.util.find_spec(name) is not None for name in ("ollama", "PIL"))
+
+def _cache_dir() -> Optional[str]:
+    if os.getenv("LOGICORE_DOC_CACHE", "1").lower() in ("0", "false", "no"):
+        return None
+    return os.getenv("LOGICORE_DOC_CACHE_DIR") or os.path.join(
+        os.path.expanduser("~"), ".cache", "logicore", "doc_text"
+    )
+
+def _cache_path(file_path: str) -> Optional[str]:
+    """Cache file for the current on-disk version of ``file_path``."""
+    cache_dir = _cache_dir()
+    if cache_dir is None:
+        return None
+    path = os.path.abspath(file_path)
+    st = os.stat(path)
+    # Whether OCR could run changes the text of scanned pages and images
+    key = f"{_CACHE_VERSION}:{int(_vision_installed())}:{path}:{st.st_mtime_ns}:{st.st_size}".encode("utf-8")
+    return os.path.join(cache_dir, hashlib.blake2b(key, digest_size=16).hexdigest() + ".json")
+
+def _prune(cache_dir: str) -> None:
+    """
+    Drop entries older than MAX_CACHE_AGE_DAYS, then the oldest until under
+    MAX_CACHE_MB. Entries readable by other users (written before the cache
+    was made private) are dropped too.
+    """
+    entries = []
+    with os.scandir(cache_dir) as it:
+        for entry in it:
+            if entry.name.endswith(".json") and entry.is_file(follow_symlinks=False):
+                st = entry.stat(follow_symlinks=False)
+                # Sorts first, so it is always removed
+                mtime = 0.0 if st.st_mode & 0o077 else st.st_mtime
+                entries.append((mtime, st.st_size, entry.path))
+    entries.sort()
+    cutoff = time.time() - MAX_CACHE_AGE_DAYS * 86400
+    budget = MAX_CACHE_MB * 1024 * 1024
+    total = sum(size for _, size, _ in entries)
+    for mtime, size, path in entries:
+        if mtime >= cutoff and total <= budget:
+            break
+        try:
+            os.remove(path)
+        except OSError:
+            continue
+        total -= size
+
+
+class CachedTextMixin:
+    """
+    Persists a handler's extracted ``_text`` and ``_metadata`` on disk, keyed
+    by absolute path, mtime and size, so unchanged files are not re-parsed
+    across runs. Handlers implement ``_parse()`` instead of ``load()``, and
+    pass OCR output through ``_check_ocr()`` (or set ``_ocr_incomplete``
+    when an OCR call raises) so a parse that lost OCR text is not cached.
+    """
+
+    _loaded = False
+    _ocr_incomplete = False
+
+    def _parse(self) -> None:
+        raise NotImplementedError
+
+    def load(self) -> None:
+        if not self._read_text_cache():
+            self._ocr_incomplete = False
+            self._parse()
+            if not self._ocr_incomplete:
+                self._write_text_cache()
+        self._loaded = True
+
+    def _check_ocr(self, text: str) -> str:
+        """Return an OCR result unchanged, noting whether it is an error report."""
+        if is_ocr_failure(text):
+            self._ocr_incomplete = True
+        return text
+
+    def get_text(self) -> str:
+        if not self._loaded:
+            self.load()
+        return self._text
+
+    def get_metadata(self):
+        if not self._loaded:
+            self.load()
+        return self._metadata
+
+    def _read_text_cache(self) -> bool:
+        try:
+            path = _cache_path(self.file_path)
+            if path is None:
+                return False
+            with open(path, "r", encoding="utf-8") as f:
+                entry = json.load(f)
+            self._text = entry["text"]
+            self._metadata = entry["metadata"]
+            return True
+        except (OSError, ValueError, KeyError, TypeError):
+            return False
+
+    def _write_text_cache(self) -> None:
+        # Best effort: a read-only or full cache dir must not fail the load
+        try:
+            path = _cache_path(self.file_path)
+            if path is None:
+                return
+            cache_dir = os.path.dirname(path)
+            os.makedirs(cache_dir, mode=_DIR_MODE, exist_ok=True)
+            tmp_path = f"{path}.{os.getpid()}.tmp"
+            fd = os.open(tmp_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, _FILE_MODE)
+            with open(fd, "w", encoding="utf-8") as f:
+                if hasattr(os, "fchmod"):
+                    # A leftover temp file keeps its old mode despite O_CREAT's
+                    os.fchmod(f.fileno(), _FILE_MODE)
+                json.dump({"text": self._text, "metadata": self._metadata}, f, default=str)
+            os.replace(tmp_path, path)
+            _prune(cache_dir)
+        except (OSError, ValueError, TypeError):
+            pass
@@ -1,7 +1,8 @@
-from typing import Dict, Any
-from .base import BaseDocumentHandler
+import itertools
+from .base import BaseDocumentHandler, compact_metadata, str_or_none
+from .cache import CachedTextMixin
 
-class DocxHandler(BaseDocumentHandler):
+class DocxHandler(CachedTextMixin, BaseDocumentHandler):
     """Handler for Word documents (.docx) using python-docx."""
 
     def __init__(self, file_path: str):
@@ -10,7 +11,7 @@ class DocxHandler(BaseDocumentHandler):
         self._text = ""
         self._metadata = {}
 
-    def load(self) -> None:
+    def _parse(self) -> None:
         """Load and parse the DOCX file with OllamaVision for embedded images."""
         try:
             import docx
@@ -20,16 +21,15 @@ class DocxHandler(BaseDocumentHandler):
         try:
             self._doc = docx.Document(self.file_path)
             
-            # Extract text from paragraphs
-            text_parts = [para.text for para in self._doc.paragraphs]
-            
-            # Extract text from tables
-            for table in self._doc.tables:
-                for row in table.rows:
-                    row_text = " | ".join([cell.text for cell in row.cells])
-                    text_parts.append(row_text)
-            
-            self._text = "\n\n".join(text_parts)
+            # Paragraph text (blank paragraphs skipped, so they don't leave
+            # runs of empty lines), then one line per table row
+            paragraphs = (text for text in (para.text for para in self._doc.paragraphs) if text)
+            rows = (
+                " | ".join(cell.text for cell in row.cells)
+                for table in self._doc.tables
+                for row in table.rows
+            )
+            self._text = "\n\n".join(itertools.chain(paragraphs, rows))
             
             # Extract and OCR images using OllamaVision
             try:
@@ -43,11 +43,15 @@ class DocxHandler(BaseDocumentHandler):
                         try:
                             image_data = rel.target_part.blob
                             image = Image.open(BytesIO(image_data))
-                            ocr_text = OllamaVisionService.get_text_from_pil_image(image)
-                            if ocr_text.strip():
-                                image_texts.append(ocr_text)
                         except:
                             continue
+                        try:
+                            ocr_text = self._check_ocr(OllamaVisionService.get_text_from_pil_image(image))
+                        except Exception:
+                            self._ocr_incomplete = True
+                            continue
+                        if ocr_text.strip():
+                            image_texts.append(ocr_text)
                 
                 if image_texts:
                     self._text += "\n\n[Embedded Images Text via OllamaVision]:\n" + "\n".join(image_texts)
@@ -59,25 +63,15 @@ class DocxHandler(BaseDocumentHandler):
             core_props = self._doc.core_properties
             self._metadata.update({
                 "author": core_props.author,
-                "created": str(core_props.created),
-                "modified": str(core_props.modified),
+                "created": str_or_none(core_props.created),
+                "modified": str_or_none(core_props.modified),
                 "title": core_props.title,
                 "subject": core_props.subject,
                 "keywords": core_props.keywords,
                 "last_modified_by": core_props.last_modified_by,
             })
-            # Remove None values
-            self._metadata = {k: v for k, v in self._metadata.items() if v is not None}
+            # Drop empty and redundant fields
+            self._metadata = compact_metadata(self._metadata)
             
         except Exception as e:
             raise RuntimeError(f"Failed to load DOCX file {self.file_path}: {e}")
-
-    def get_text(self) -> str:
-        if self._doc is None:
-            self.load()
-        return self._text
-
-    def get_metadata(self) -> Dict[str, Any]:
-        if self._doc is None:
-            self.load()
-        return self._metadata
@@ -1,5 +1,5 @@
 from typing import Dict, Any
-from .base import BaseDocumentHandler
+from .base import BaseDocumentHandler, compact_metadata, str_or_none
 
 class ExcelHandler(BaseDocumentHandler):
     """Handler for Excel spreadsheets (.xlsx) using openpyxl."""
@@ -41,16 +41,16 @@ class ExcelHandler(BaseDocumentHandler):
             props = self._wb.properties
             self._metadata = {
                 "author": props.creator,
-                "created": str(props.created),
-                "modified": str(props.modified),
+                "created": str_or_none(props.created),
+                "modified": str_or_none(props.modified),
                 "title": props.title,
                 "subject": props.subject,
                 "keywords": props.keywords,
                 "category": props.category,
                 "sheet_names": self._wb.sheetnames
             }
-             # Remove None values
-            self._metadata = {k: v for k, v in self._metadata.items() if v is not None}
+            # Drop empty and redundant fields
+            self._metadata = compact_metadata(self._metadata)
 
         except Exception as e:
             raise RuntimeError(f"Failed to load Excel file {self.file_path}: {e}")
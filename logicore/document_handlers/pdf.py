@@ -1,94 +1,143 @@
-from typing import Dict, Any
-from .base import BaseDocumentHandler
+import importlib.util
+import io
+from concurrent.futures import ThreadPoolExecutor
+from typing import Iterator, List, Tuple
+from .base import BaseDocumentHandler, compact_metadata
+from .cache import CachedTextMixin, is_ocr_failure
 
-class PDFHandler(BaseDocumentHandler):
+# Upper bound on concurrent OCR requests for one scanned page
+MAX_OCR_WORKERS = 4
+
+class PDFHandler(CachedTextMixin, BaseDocumentHandler):
     """Handler for PDF documents using PyPDFLoader with OllamaVision fallback for scanned pages."""
 
-    def __init__(self, file_path: str):
+    def __init__(self, file_path: str, parallel: bool = True):
         super().__init__(file_path)
+        self.parallel = parallel
         self._reader = None
         self._text = ""
         self._metadata = {}
 
-    def load(self) -> None:
+    def _parse(self) -> None:
         """Load and parse the PDF file using PyPDFLoader with OllamaVision fallback for scanned pages."""
+        # PyPDFLoader itself is imported where pages are loaded
         try:
-            from langchain_community.document_loaders import PyPDFLoader
             import pypdf
         except ImportError:
             raise RuntimeError("langchain_community or pypdf is not installed.")
+        if importlib.util.find_spec("langchain_community") is None:
+            raise RuntimeError("langchain_community or pypdf is not installed.")
 
         try:
-            # 1. Load Text via PyPDFLoader
-            loader = PyPDFLoader(self.file_path)
-            documents = loader.load()
-            
-            final_text_parts = []
             reader = pypdf.PdfReader(self.file_path)
             
-            # Check if Ollama Vision is available
-            try:
-                from ..services.ollama_vision import OllamaVisionService
-                from PIL import Image
-                from io import BytesIO
-                VISION_AVAILABLE = True
-            except ImportError:
-                VISION_AVAILABLE = False
-            
-            for i, doc in enumerate(documents):
-                page_text = doc.page_content
-                
-                # Check if page is likely scanned (has images, little text)
-                is_scanned = False
-                try:
-                    if i < len(reader.pages):
-                        page = reader.pages[i]
-                        if len(page.images) > 0 and len(page_text.strip()) < 50:
-                            is_scanned = True
-                except:
-                    pass
-                
-                # If scanned and Vision available, OCR the images
-                if is_scanned and VISION_AVAILABLE:
-                    image_texts = []
-                    try:
-                        for img_obj in reader.pages[i].images:
-                            try:
-                                image = Image.open(BytesIO(img_obj.data))
-                                ocr_text = OllamaVisionService.get_text_from_pil_image(image)
-                                if ocr_text.strip():
-                                    image_texts.append(ocr_text)
-                            except:
-                                continue
-                    except:
-                        pass
-                    
-                    if image_texts:
-                        combined = "\n".join(image_texts)
-                        final_text_parts.append(f"--- Page {i+1} (OllamaVision) ---\n{combined}")
-                        self._metadata[f"page_{i+1}_engine"] = "ollama_vision"
-                        continue
-                
-                # Standard text
-                final_text_parts.append(page_text)
-            
-            self._text = "\n\n".join(final_text_parts).strip()
+            # Pages are written out as they are produced, so only one page's
+            # text is held besides the buffer
+            buf = io.StringIO()
+            sep = ""
+            for page_text in self._iter_pages(reader, record=True):
+                buf.write(sep)
+                buf.write(page_text)
+                sep = "\n\n"
+            self._text = buf.getvalue().strip()
             
             # Extract metadata
             if reader.metadata:
                 for key, value in reader.metadata.items():
                     clean_key = key[1:] if key.startswith('/') else key
                     self._metadata[clean_key] = value
+            self._metadata = compact_metadata(self._metadata)
+            
+            self._reader = reader
                     
         except Exception as e:
             raise RuntimeError(f"Failed to load PDF file {self.file_path}: {e}")
 
-    def get_text(self) -> str:
-        if self._reader is None:
-            self.load()
-        return self._text
+    def iter_pages(self) -> Iterator[str]:
+        """
+        Yield the text of each page in order, OCR-ing scanned pages when
+        OllamaVision is available. Pages are loaded lazily, so callers that
+        chunk or embed page by page never hold the whole document.
+        """
+        import pypdf
+        return self._iter_pages(pypdf.PdfReader(self.file_path))
+
+    def _iter_pages(self, reader, record: bool = False) -> Iterator[str]:
+        """
+        Page texts for ``reader``. With ``record`` set (only while parsing),
+        OCR'd pages are noted in the metadata and failed OCR keeps the result
+        out of the text cache; otherwise the handler is left untouched.
+        """
+        from langchain_community.document_loaders import PyPDFLoader
+
+        # 1. Load Text via PyPDFLoader
+        loader = PyPDFLoader(self.file_path)
+        
+        # Check if Ollama Vision is available
+        try:
+            from ..services.ollama_vision import OllamaVisionService
+            from PIL import Image
+            from io import BytesIO
+            VISION_AVAILABLE = True
+        except ImportError:
+            VISION_AVAILABLE = False
+        
+        for i, doc in enumerate(loader.lazy_load()):
+            page_text = doc.page_content
+            
+            # Check if page is likely scanned (has images, little text)
+            is_scanned = False
+            try:
+                if i < len(reader.pages):
+                    page = reader.pages[i]
+                    if len(page.images) > 0 and len(page_text.strip()) < 50:
+                        is_scanned = True
+            except:
+                pass
+            
+            # If scanned and Vision available, OCR the images
+            if is_scanned and VISION_AVAILABLE:
+                images = []
+                try:
+                    for img_obj in reader.pages[i].images:
+                        try:
+                            images.append(Image.open(BytesIO(img_obj.data)))
+                        except:
+                            continue
+                except:
+                    pass
+                image_texts, failed = self._ocr_images(OllamaVisionService, images)
+                if failed and record:
+                    self._ocr_incomplete = True
+                
+                if image_texts:
+                    combined = "\n".join(image_texts)
+                    if record:
+                        self._metadata[f"page_{i+1}_engine"] = "ollama_vision"
+                    yield f"--- Page {i+1} (OllamaVision) ---\n{combined}"
+                    continue
+            
+            # Standard text
+            yield page_text
+
+    def _ocr_images(self, vision, images) -> Tuple[List[str], bool]:
+        """
+        OCR a page's images, returning the non-empty results in image order
+        and whether any request failed.
+        Each image is a separate Ollama request, so with ``parallel`` set they
+        are sent concurrently; the images themselves are decoded beforehand
+        on the calling thread, which owns the PDF stream.
+        """
+        def ocr(image) -> Tuple[str, bool]:
+            try:
+                text = vision.get_text_from_pil_image(image)
+            except Exception:
+                return "", True
+            return text, is_ocr_failure(text)
 
-    def get_metadata(self) -> Dict[str, Any]:
-        if self._reader is None:
-            self.load()
-        return self._metadata
+        if self.parallel and len(images) > 1:
+            with ThreadPoolExecutor(max_workers=min(MAX_OCR_WORKERS, len(images))) as pool:
+                texts = list(pool.map(ocr, images))
+        else:
+            texts = [ocr(image) for image in images]
+        return [text for text, _ in texts if text.strip()], any(failed for _, failed in texts)
@@ -1,7 +1,8 @@
-from typing import Dict, Any
-from .base import BaseDocumentHandler
+import io
+from .base import BaseDocumentHandler, compact_metadata, str_or_none
+from .cache import CachedTextMixin
 
-class PPTXHandler(BaseDocumentHandler):
+class PPTXHandler(CachedTextMixin, BaseDocumentHandler):
     """Handler for PowerPoint presentations (.pptx) using python-pptx with Ollama Vision fallback."""
 
     def __init__(self, file_path: str):
@@ -10,7 +11,7 @@ class PPTXHandler(BaseDocumentHandler):
         self._text = ""
         self._metadata = {}
 
-    def load(self) -> None:
+    def _parse(self) -> None:
         """Load and parse the PPTX file using a hybrid approach."""
         try:
             from pptx import Presentation
@@ -21,7 +22,10 @@ class PPTXHandler(BaseDocumentHandler):
         try:
             self._prs = Presentation(self.file_path)
             
-            text_content = []
+            # Slides are written straight into one buffer rather than joined
+            # per slide and then again across slides
+            buf = io.StringIO()
+            sep = ""
             
             # Check availability
             try:
@@ -38,62 +42,63 @@ class PPTXHandler(BaseDocumentHandler):
                 
                 # Check shapes for text and images
                 for shape in slide.shapes:
-                    if hasattr(shape, "text") and shape.text:
-                        slide_text_parts.append(shape.text)
+                    shape_text = getattr(shape, "text", None)
+                    if shape_text:
+                        slide_text_parts.append(shape_text)
                     
                     if hasattr(shape, "shape_type") and shape.shape_type == MSO_SHAPE_TYPE.PICTURE:
                         image_shapes.append(shape)
                 
-                slide_raw_text = "\n".join(slide_text_parts)
-                
                 # Heuristic: If slide has images but very little text (< 50 chars), try OCR on the images
-                if VISION_READY and image_shapes and len(slide_raw_text.strip()) < 50:
+                if VISION_READY and image_shapes and len("\n".join(slide_text_parts).strip()) < 50:
                     ocr_segments = []
                     for img_shape in image_shapes:
                         try:
                             image_blob = img_shape.image.blob
                             image = Image.open(BytesIO(image_blob))
-                            text = OllamaVisionService.get_text_from_pil_image(image)
-                            if text.strip():
-                                ocr_segments.append(text)
                         except Exception:
-                            pass
+                            continue
+                        try:
+                            text = self._check_ocr(OllamaVisionService.get_text_from_pil_image(image))
+                        except Exception:
+                            self._ocr_incomplete = True
+                            continue
+                        if text.strip():
+                            ocr_segments.append(text)
                     
                     if ocr_segments:
                         combined_ocr = "\n".join(ocr_segments)
-                        text_content.append(f"--- Slide {i+1} (OllamaVision) ---\n{combined_ocr}")
+                        buf.write(sep)
+                        buf.write(f"--- Slide {i+1} (OllamaVision) ---\n{combined_ocr}")
+                        sep = "\n\n"
                         self._metadata[f"slide_{i+1}_engine"] = "ollama_vision"
                         continue # Skip standard text append if we used OCR
                 
                 # Standard Text
-                text_content.append(f"--- Slide {i+1} ---\n{slide_raw_text}")
+                buf.write(sep)
+                buf.write(f"--- Slide {i+1} ---\n")
+                for j, part in enumerate(slide_text_parts):
+                    if j:
+                        buf.write("\n")
+                    buf.write(part)
+                sep = "\n\n"
             
-            self._text = "\n\n".join(text_content)
+            self._text = buf.getvalue()
             
             # Extract core properties
             core_props = self._prs.core_properties
             self._metadata.update({
                 "author": core_props.author,
-                "created": str(core_props.created),
-                "modified": str(core_props.modified),
+                "created": str_or_none(core_props.created),
+                "modified": str_or_none(core_props.modified),
                 "title": core_props.title,
                 "subject": core_props.subject,
                 "keywords": core_props.keywords,
                 "last_modified_by": core_props.last_modified_by,
                 "slide_count": len(self._prs.slides)
             })
-            # Remove None values
-            self._metadata = {k: v for k, v in self._metadata.items() if v is not None}
+            # Drop empty and redundant fields
+            self._metadata = compact_metadata(self._metadata)
 
         except Exception as e:
             raise RuntimeError(f"Failed to load PPTX file {self.file_path}: {e}")
-
-    def get_text(self) -> str:
-        if self._prs is None:
-            self.load()
-        return self._text
-
-    def get_metadata(self) -> Dict[str, Any]:
-        if self._prs is None:
-            self.load()
-        return self._metadata
@@ -1,60 +1,107 @@
 import os
-from typing import Type
-from .base import BaseDocumentHandler
-from .pdf import PDFHandler
-from .docx import DocxHandler
-from .pptx import PPTXHandler
-from .excel import ExcelHandler
-from .text import TextHandler
-from .csv import CSVHandler
-from .image import ImageHandler
+import importlib
+import types
+from typing import Dict, Type
+from .base import BaseDocumentHandler, BinaryFileError
+
+# Handlers are referenced as "module:Class" (relative to this package) and
+# imported on first use, so a process only loads the handlers it needs.
+_TEXT_HANDLER = ".text:TextHandler"
+
+def _extension(file_path: str) -> str:
+    """
+    Lower-cased extension of ``file_path``, matching ``os.path.splitext``
+    without its tuple and root allocations; the ``lower()`` copy is skipped
+    for the usual already-lowercase case.
+    """
+    dot = file_path.rfind(".")
+    sep = max(file_path.rfind("/"), file_path.rfind(os.sep))
+    # No dot in the final component, or only leading dots (".bashrc")
+    if dot <= sep + 1 or not file_path[sep + 1:dot].lstrip("."):
+        return ""
+    ext = file_path[dot:]
+    return ext if ext.islower() else ext.lower()
+
+# Extension -> handler target; read-only so lookups can go straight to the
+# module global rather than through the class.
+_HANDLERS = types.MappingProxyType({
+    ".pdf": ".pdf:PDFHandler",
+    ".docx": ".docx:DocxHandler",
+    ".doc": ".docx:DocxHandler", # python-docx might handle .doc if it's actually xml, otherwise might fail, but mapping for now
+    ".pptx": ".pptx:PPTXHandler",
+    ".ppt": ".pptx:PPTXHandler", # similar caveat
+    ".xlsx": ".excel:ExcelHandler",
+    ".xls": ".excel:ExcelHandler", 
+    ".csv": ".csv:CSVHandler",
+    ".txt": _TEXT_HANDLER,
+    ".md": _TEXT_HANDLER,
+    ".py": _TEXT_HANDLER,
+    ".json": _TEXT_HANDLER,
+    ".xml": _TEXT_HANDLER,
+    ".html": _TEXT_HANDLER,
+    ".css": _TEXT_HANDLER,
+    ".js": _TEXT_HANDLER,
+    ".png": ".image:ImageHandler",
+    ".jpg": ".image:ImageHandler",
+    ".jpeg": ".image:ImageHandler",
+    ".webp": ".image:ImageHandler",
+})
+
+_RESOLVED: Dict[str, Type[BaseDocumentHandler]] = {}
+
+def _resolve(target: str) -> Type[BaseDocumentHandler]:
+    """Import (once) and return the handler class for a "module:Class" target."""
+    handler_cls = _RESOLVED.get(target)
+    if handler_cls is None:
+        module_name, _, class_name = target.partition(":")
+        handler_cls = getattr(importlib.import_module(module_name, __package__), class_name)
+        _RESOLVED[target] = handler_cls
+    return handler_cls
+
+# Leading bytes of common binary formats (ELF executables, archives / Office
+# files, images, PDFs). Files with an unregistered extension are checked
+# against these before being handed to TextHandler.
+_BINARY_MAGIC = frozenset({b"\x7fELF", b"PK\x03\x04", b"\x89PNG", b"%PDF"})
+
+def _is_pe(f, header: bytes) -> bool:
+    """
+    Windows PE executable: "MZ" alone is too weak (text can start with it),
+    so also require the "PE\\0\\0" signature at the e_lfanew offset.
+    """
+    if len(header) < 0x40 or header[:2] != b"MZ":
+        return False
+    f.seek(int.from_bytes(header[0x3C:0x40], "little"))
+    return f.read(4) == b"PE\0\0"
+
+def _check_not_binary(file_path: str) -> None:
+    """Raise BinaryFileError if ``file_path`` starts with a known binary header."""
+    try:
+        with open(file_path, "rb") as f:
+            header = f.read(0x40)
+            if header[:4] in _BINARY_MAGIC or _is_pe(f, header):
+                raise BinaryFileError(f"No handler for binary file {file_path}")
+    except OSError:
+        # Let the handler report missing/unreadable files as usual
+        return
 
 class DocumentHandlerRegistry:
     """Registry to map file extensions to document handlers."""
     
-    _handlers: dict[str, Type[BaseDocumentHandler]] = {
-        ".pdf": PDFHandler,
-        ".docx": DocxHandler,
-        ".doc": DocxHandler, # python-docx might handle .doc if it's actually xml, otherwise might fail, but mapping for now
-        ".pptx": PPTXHandler,
-        ".ppt": PPTXHandler, # similar caveat
-        ".xlsx": ExcelHandler,
-        ".xls": ExcelHandler, 
-        ".csv": CSVHandler,
-        ".txt": TextHandler,
-        ".md": TextHandler,
-        ".py": TextHandler,
-        ".json": TextHandler,
-        ".xml": TextHandler,
-        ".html": TextHandler,
-        ".css": TextHandler,
-        ".js": TextHandler,
-        ".png": ImageHandler,
-        ".jpg": ImageHandler,
-        ".jpeg": ImageHandler,
-        ".webp": ImageHandler,
-    }
+    _handlers = _HANDLERS
 
     @classmethod
     def get_handler(cls, file_path: str) -> BaseDocumentHandler:
         """
         Return an instance of the appropriate handler for the given file path.
-        Raises ValueError if no handler is found.
+        Unregistered extensions fall back to TextHandler, which reads with
+        errors="replace", unless the file has a known binary header, in which
+        case BinaryFileError is raised.
         """
-        _, ext = os.path.splitext(file_path)
-        ext = ext.lower()
-        
-        handler_cls = cls._handlers.get(ext)
-        if handler_cls:
-            return handler_cls(file_path)
-            
-        # Fallback for text-like files not explicitly listed? 
-        # Maybe safer to return TextHandler for unknown types if they look like text?
-        # For now, strictly follow registry or default to TextHandler if we want "general purpose".
-        # Let's default to TextHandler but maybe warn.
-        
-        # Actually, let's just default to TextHandler. It handles read errors gracefully-ish.
-        return TextHandler(file_path)
+        target = _HANDLERS.get(_extension(file_path))
+        if target is None:
+            _check_not_binary(file_path)
+            target = _TEXT_HANDLER
+        return _resolve(target)(file_path)
 
 def get_handler(file_path: str) -> BaseDocumentHandler:
     """Convenience function to get a handler instance."""
@@ -2,11 +2,24 @@ import asyncio
 import json
 import os
 import shutil
-from typing import Dict, Any, List, Optional
+from typing import Dict, Any, List, Optional, Tuple
 from mcp import ClientSession, StdioServerParameters
 from mcp.client.stdio import stdio_client
 from mcp.types import CallToolResult
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# Parsed mcp.json files keyed by absolute path -> ((mtime_ns, size), config).
+# Re-parsing is skipped while the file on disk is unchanged, which makes
+# repeated agent/manager initialisation (e.g. reloader bounces) cheap.
+_CONFIG_CACHE: Dict[str, Tuple[Tuple[int, int], Dict[str, Any]]] = {}
+
+# Upper bound on MCP servers started at the same time by connect_to_servers
+MAX_CONCURRENT_CONNECTS = 8
+
 class MCPClientManager:
     """
     Manages connections to external MCP servers defined in mcp.json.
@@ -18,6 +31,7 @@ class MCPClientManager:
         self.config = config
         self.sessions: Dict[str, ClientSession] = {}
         self.server_tools_map: Dict[str, str] = {}  # tool_name -> server_name
+        self.server_tool_schemas: Dict[str, List[Dict[str, Any]]] = {}  # server_name -> tool schemas
         
         # Task management
         self.server_tasks: Dict[str, asyncio.Task] = {}
@@ -28,16 +42,28 @@ class MCPClientManager:
         if self.config:
             return self.config
 
-        if not os.path.exists(self.config_path):
+        path = os.path.abspath(self.config_path)
+        try:
+            st = os.stat(path)
+        except OSError:
             return {}
-            
+
+        signature = (st.st_mtime_ns, st.st_size)
+        cached = _CONFIG_CACHE.get(path)
+        if cached and cached[0] == signature:
+            return cached[1]
+
         try:
-            with open(self.config_path, 'r') as f:
-                return json.load(f)
+            with open(path, 'rb') as f:
+                raw = f.read()
+            config = orjson.loads(raw) if orjson else json.loads(raw)
         except Exception as e:
             print(f"[MCP Client] Error loading config: {e}")
             return {}
 
+        _CONFIG_CACHE[path] = (signature, config)
+        return config
+
     async def _run_server_connection(self, server_name: str, params: StdioServerParameters, ready_event: asyncio.Event):
         """Background task to maintain connection to an MCP server."""
         try:
@@ -72,83 +98,103 @@ class MCPClientManager:
         config = await self.load_config()
         servers = config.get("mcpServers", {})
         
-        for server_name, server_config in servers.items():
-            # Skip if it's the logicore server itself to avoid recursion
-            if server_name.startswith("logicore"):
-                continue
-            
-            # Skip if already connected
-            if server_name in self.sessions:
-                continue
+        pending = [
+            self._connect_server(server_name, server_config)
+            for server_name, server_config in servers.items()
+            # Skip the logicore server itself (avoids recursion) and live sessions
+            if not server_name.startswith("logicore") and server_name not in self.sessions
+        ]
+        # Servers start independently, so one slow server no longer delays the
+        # rest; the semaphore bounds how many subprocesses spawn at once.
+        if pending:
+            limit = asyncio.Semaphore(MAX_CONCURRENT_CONNECTS)
+
+            async def bounded(connect):
+                async with limit:
+                    await connect
+
+            await asyncio.gather(*(bounded(connect) for connect in pending))
 
+    async def _connect_server(self, server_name: str, server_config: Dict[str, Any]):
+        """Start one server connection and register its tools."""
+        try:
+            command = server_config.get("command")
+            args = server_config.get("args", [])
+            env = server_config.get("env", {})
+            
+            # Merge current env with config env
+            full_env = os.environ.copy()
+            full_env.update(env)
+            
+            # Resolve command path
+            cmd_path = shutil.which(command) or command
+            
+            server_params = StdioServerParameters(
+                command=cmd_path,
+                args=args,
+                env=full_env
+            )
+            
+            # Prepare events
+            ready_event = asyncio.Event()
+            stop_event = asyncio.Event()
+            self.server_stop_events[server_name] = stop_event
+            
+            # Start background task
+            task = asyncio.create_task(self._run_server_connection(server_name, server_params, ready_event))
+            self.server_tasks[server_name] = task
+            
+            # Wait for interaction (timeout 10s)
             try:
-                command = server_config.get("command")
-                args = server_config.get("args", [])
-                env = server_config.get("env", {})
-                
-                # Merge current env with config env
-                full_env = os.environ.copy()
-                full_env.update(env)
-                
-                # Resolve command path
-                cmd_path = shutil.which(command) or command
-                
-                server_params = StdioServerParameters(
-                    command=cmd_path,
-                    args=args,
-                    env=full_env
-                )
-                
-                # Prepare events
-                ready_event = asyncio.Event()
-                stop_event = asyncio.Event()
-                self.server_stop_events[server_name] = stop_event
-                
-                # Start background task
-                task = asyncio.create_task(self._run_server_connection(server_name, server_params, ready_event))
-                self.server_tasks[server_name] = task
+                await asyncio.wait_for(ready_event.wait(), timeout=10.0)
                 
-                # Wait for interaction (timeout 10s)
-                try:
-                    await asyncio.wait_for(ready_event.wait(), timeout=10.0)
+                if server_name in self.sessions:
+                    print(f"[MCP Client] Connected to server: {server_name}")
                     
-                    if server_name in self.sessions:
-                        print(f"[MCP Client] Connected to server: {server_name}")
-                        
-                        # List tools and map them
-                        result = await self.sessions[server_name].list_tools()
-                        print(f"[MCP Client] Found {len(result.tools)} tools from {server_name}")
-                        for tool in result.tools:
-                            self.server_tools_map[tool.name] = server_name
-                    else:
-                        print(f"[MCP Client] Failed to connect to {server_name} (Initialization failed)")
-                        
-                except asyncio.TimeoutError:
-                    print(f"[MCP Client] Timeout connecting to {server_name}")
-                    # Don't kill the task, it might just be slow, but we can't wait forever
+                    # List tools and map them
+                    result = await self.sessions[server_name].list_tools()
+                    print(f"[MCP Client] Found {len(result.tools)} tools from {server_name}")
+                    for tool in result.tools:
+                        self.server_tools_map[tool.name] = server_name
+                    self.server_tool_schemas[server_name] = [self._to_schema(t) for t in result.tools]
+                else:
+                    print(f"[MCP Client] Failed to connect to {server_name} (Initialization failed)")
                     
-            except Exception as e:
-                print(f"[MCP Client] Failed to setup {server_name}: {e}")
+            except asyncio.TimeoutError:
+                print(f"[MCP Client] Timeout connecting to {server_name}")
+                # Don't kill the task, it might just be slow, but we can't wait forever
+                
+        except Exception as e:
+            print(f"[MCP Client] Failed to setup {server_name}: {e}")
+
+    @staticmethod
+    def _to_schema(tool) -> Dict[str, Any]:
+        """Convert an MCP tool definition to OpenAI/Agentry schema format."""
+        return {
+            "type": "function",
+            "function": {
+                "name": tool.name,
+                "description": tool.description,
+                "parameters": tool.inputSchema
+            }
+        }
 
     async def get_tools(self) -> List[Dict[str, Any]]:
         """Get all tools from connected servers in OpenAI/Agentry schema format."""
         all_tools = []
         
         for server_name, session in self.sessions.items():
-            try:
-                result = await session.list_tools()
-                for tool in result.tools:
-                    logicore_tool = {
-                        "type": "function",
-                        "function": {
-                            "name": tool.name,
-                            "description": tool.description,
-                            "parameters": tool.inputSchema
-                        }
-                    }
-                    all_tools.append(logicore_tool)
-            except Exception as e:
-                print(f"[MCP Client] Error listing tools from {server_name}: {e}")
+            # Listed once at connect time; only query servers we have no schemas for
+            schemas = self.server_tool_schemas.get(server_name)
+            if schemas is None:
+                try:
+                    result = await session.list_tools()
+                    schemas = [self._to_schema(t) for t in result.tools]
+                    self.server_tool_schemas[server_name] = schemas
+                except Exception as e:
+                    print(f"[MCP Client] Error listing tools from {server_name}: {e}")
+                    continue
+            all_tools.extend(schemas)
                 
         return all_tools
 
@@ -196,3 +242,4 @@ class MCPClientManager:
         self.server_stop_events.clear()
         self.sessions.clear()
         self.server_tools_map.clear()
+        self.server_tool_schemas.clear()
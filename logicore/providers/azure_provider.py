@@ -1,8 +1,6 @@
 import os
-import base64
-import re
 import asyncio
-import json
+import inspect
 import logging
 from typing import List, Dict, Any, Optional, Union
 from .base import LLMProvider
@@ -61,6 +59,8 @@ class AzureProvider(LLMProvider):
         self.api_key = api_key or os.environ.get("AZURE_API_KEY") or os.environ.get("AZURE_OPENAI_API_KEY")
         self.endpoint = (endpoint or os.environ.get("AZURE_ENDPOINT") or os.environ.get("AZURE_OPENAI_ENDPOINT", "")).rstrip("/")
         self.kwargs = kwargs
+        # id(message) -> (message, converted Anthropic message) for the last request
+        self._anthropic_msg_cache: Dict[int, tuple] = {}
         
         if not self.api_key:
             raise ValueError("Azure API key is required. Provide api_key or set AZURE_API_KEY env var.")
@@ -202,6 +202,7 @@ class AzureProvider(LLMProvider):
         accumulated_content = ""
         tool_call_chunks = {}
 
+        token_is_async = inspect.iscoroutinefunction(on_token)
         for chunk in stream:
             if not chunk or not hasattr(chunk, 'choices') or not chunk.choices: continue
             delta = chunk.choices[0].delta
@@ -209,8 +210,7 @@ class AzureProvider(LLMProvider):
             if hasattr(delta, 'content') and delta.content:
                 accumulated_content += delta.content
                 if on_token:
-                    import inspect
-                    if inspect.iscoroutinefunction(on_token): await on_token(delta.content)
+                    if token_is_async: await on_token(delta.content)
                     else: on_token(delta.content)
             
             if hasattr(delta, 'tool_calls') and delta.tool_calls:
@@ -252,7 +252,6 @@ class AzureProvider(LLMProvider):
     # --- Anthropic Implementation ---
 
     async def _chat_anthropic(self, messages: List[Dict[str, Any]], tools: Optional[List[Dict[str, Any]]] = None) -> Any:
-        from .utils import extract_content
         system_msg, anthropic_msgs = self._format_messages_for_anthropic(messages)
         
         kwargs = {
@@ -267,8 +266,7 @@ class AzureProvider(LLMProvider):
         if tools:
             kwargs["tools"] = self._format_tools_for_anthropic(tools)
 
-        loop = asyncio.get_event_loop()
-        response = await loop.run_in_executor(None, lambda: self.client.messages.create(**kwargs))
+        response = await asyncio.to_thread(self.client.messages.create, **kwargs)
         
         content = "".join([b.text for b in response.content if hasattr(b, 'text')])
         # Handle tool calls in response if any...
@@ -299,6 +297,7 @@ class AzureProvider(LLMProvider):
         acc_text = ""
         acc_tools = []
         
+        token_is_async = inspect.iscoroutinefunction(on_token)
         while True:
             try:
                 msg_type, data = q.get(timeout=60)
@@ -309,8 +308,7 @@ class AzureProvider(LLMProvider):
                 if event.type == 'content_block_delta' and hasattr(event.delta, 'text'):
                     acc_text += event.delta.text
                     if on_token:
-                        import inspect
-                        if inspect.iscoroutinefunction(on_token): await on_token(event.delta.text)
+                        if token_is_async: await on_token(event.delta.text)
                         else: on_token(event.delta.text)
                 elif event.type == 'content_block_start' and event.content_block.type == 'tool_use':
                     acc_tools.append({"id": event.content_block.id, "name": event.content_block.name, "args": ""})
@@ -322,9 +320,19 @@ class AzureProvider(LLMProvider):
         return MockMessage(content=acc_text, role="assistant", tool_calls=final_tool_calls or None)
 
     def _format_messages_for_anthropic(self, messages: List[Dict[str, Any]]):
-        from .utils import extract_content
+        """
+        Convert history to Anthropic (system, messages).
+
+        Converted messages are reused across calls while the history keeps the
+        same message objects (it is append-only; entries are replaced, never
+        edited in place), so earlier turns - images in particular - are not
+        re-encoded on every tool iteration. The system block carries a
+        cache_control breakpoint so the tools + system prefix is prompt-cached.
+        """
         system_content = None
         anthropic_msgs = []
+        previous = self._anthropic_msg_cache
+        cache: Dict[int, tuple] = {}
         
         for msg in messages:
             if msg["role"] == "system":
@@ -333,28 +341,45 @@ class AzureProvider(LLMProvider):
                 if isinstance(content, str):
                     system_content = [{"type": "text", "text": content}]
                 elif isinstance(content, list):
-                    system_content = content
+                    system_content = list(content)
                 else:
                     # If it's not a string or list, treat it as a single text block
                     system_content = [{"type": "text", "text": str(content)}]
-            elif msg["role"] == "tool":
-                anthropic_msgs.append({
-                    "role": "user",
-                    "content": [{"type": "tool_result", "tool_use_id": msg["tool_call_id"], "content": msg["content"]}]
-                })
+                continue
+
+            hit = previous.get(id(msg))
+            if hit is not None and hit[0] is msg:
+                converted = hit[1]
             else:
-                raw = msg.get("content", "")
-                text, images = extract_content(raw)
-                blocks = []
-                for img in images:
-                    data = img["data"]
-                    if isinstance(data, bytes): data = base64.b64encode(data).decode('utf-8')
-                    blocks.append({"type": "image", "source": {"type": "base64", "media_type": img.get("mime_type", "image/png"), "data": data}})
-                if text: blocks.append({"type": "text", "text": text})
-                anthropic_msgs.append({"role": msg["role"], "content": blocks or ""})
+                converted = self._convert_message_for_anthropic(msg)
+            cache[id(msg)] = (msg, converted)
+            anthropic_msgs.append(converted)
+
+        self._anthropic_msg_cache = cache
+
+        if system_content and isinstance(system_content[-1], dict):
+            system_content[-1] = {**system_content[-1], "cache_control": {"type": "ephemeral"}}
         
         return system_content, anthropic_msgs
 
+    @staticmethod
+    def _convert_message_for_anthropic(msg: Dict[str, Any]) -> Dict[str, Any]:
+        from .utils import extract_content, b64encode_str
+        if msg["role"] == "tool":
+            return {
+                "role": "user",
+                "content": [{"type": "tool_result", "tool_use_id": msg["tool_call_id"], "content": msg["content"]}]
+            }
+        raw = msg.get("content", "")
+        text, images = extract_content(raw)
+        blocks = []
+        for img in images:
+            data = img["data"]
+            if isinstance(data, bytes): data = b64encode_str(data)
+            blocks.append({"type": "image", "source": {"type": "base64", "media_type": img.get("mime_type", "image/png"), "data": data}})
+        if text: blocks.append({"type": "text", "text": text})
+        return {"role": msg["role"], "content": blocks or ""}
+
     def _format_tools_for_anthropic(self, tools: List[Dict[str, Any]]):
         a_tools = []
         for t in tools:
@@ -371,20 +396,19 @@ class AzureProvider(LLMProvider):
             return await self._chat_openai(messages, tools)
             
         # Fallback to raw HTTP if client init failed (legacy/fallback)
-        import httpx
+        from .utils import get_shared_async_client
         url = f"{self.endpoint}/chat/completions?api-version={self.api_version}"
         headers = {"Content-Type": "application/json", "Authorization": f"Bearer {self.api_key}"}
         
         payload = {"messages": messages, "model": self.deployment_name}
         if tools: payload["tools"] = tools
 
-        async with httpx.AsyncClient() as client:
-            resp = await client.post(url, headers=headers, json=payload, timeout=60)
-            resp.raise_for_status()
-            data = resp.json()
-            # Return normalized message
-            msg = data["choices"][0]["message"]
-            return MockMessage(content=msg.get("content", ""), role="assistant", tool_calls=msg.get("tool_calls"))
+        resp = await get_shared_async_client().post(url, headers=headers, json=payload, timeout=60)
+        resp.raise_for_status()
+        data = resp.json()
+        # Return normalized message
+        msg = data["choices"][0]["message"]
+        return MockMessage(content=msg.get("content", ""), role="assistant", tool_calls=msg.get("tool_calls"))
 
     # --- Utils ---
 
@@ -283,16 +283,16 @@ class GeminiProvider(LLMProvider):
             def get_stream():
                 return self.client.models.generate_content_stream(model=self.model_name, contents=contents, config=config)
 
-            loop = asyncio.get_event_loop()
-            stream = await loop.run_in_executor(None, get_stream)
+            stream = await asyncio.to_thread(get_stream)
             
+            token_is_async = inspect.iscoroutinefunction(on_token)
             for chunk in stream:
                 # Extract text
                 if chunk.text:
                     token = chunk.text
                     assistant_content += token
                     if on_token:
-                        if inspect.iscoroutinefunction(on_token):
+                        if token_is_async:
                             await on_token(token)
                         else:
                             on_token(token)
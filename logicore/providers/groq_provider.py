@@ -1,5 +1,4 @@
 import os
-import base64
 from groq import Groq
 from typing import List, Dict, Any, Optional, Callable, Union
 from .base import LLMProvider
@@ -16,7 +15,7 @@ class GroqProvider(LLMProvider):
 
     def _convert_local_images_to_base64(self, messages: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
         """Convert local image file paths to base64 data URLs for Groq API."""
-        import mimetypes
+        from .utils import encode_file_base64, mime_type_for_path
         
         converted_messages = []
         for msg in messages:
@@ -37,15 +36,14 @@ class GroqProvider(LLMProvider):
                         
                         if url and not url.startswith(("http://", "https://", "data:")):
                             url = str(url).replace("\\\\", "\\")
-                            if os.path.isfile(url):
-                                try:
-                                    with open(url, "rb") as f:
-                                        image_data = f.read()
-                                    mime_type, _ = mimetypes.guess_type(url)
-                                    mime_type = mime_type or "image/jpeg"
-                                    new_part["image_url"] = {"url": f"data:{mime_type};base64,{base64.b64encode(image_data).decode('utf-8')}"}
-                                except Exception as e:
-                                    pass
+                            # Opening directly doubles as the isfile check
+                            # (missing paths and directories raise OSError).
+                            try:
+                                encoded = encode_file_base64(url)
+                                mime_type = mime_type_for_path(url) or "image/jpeg"
+                                new_part["image_url"] = {"url": f"data:{mime_type};base64,{encoded}"}
+                            except Exception as e:
+                                pass
                         
                         new_content.append(new_part)
                     else:
@@ -125,6 +123,7 @@ class GroqProvider(LLMProvider):
             accumulated_content = ""
             tool_call_chunks = {}
             
+            token_is_async = inspect.iscoroutinefunction(on_token)
             for chunk in stream:
                 if not chunk or not chunk.choices:
                     continue
@@ -134,7 +133,7 @@ class GroqProvider(LLMProvider):
                     token = delta.content
                     accumulated_content += token
                     if on_token:
-                        if inspect.iscoroutinefunction(on_token):
+                        if token_is_async:
                             await on_token(token)
                         else:
                             on_token(token)
@@ -1,17 +1,28 @@
-import ollama
+import concurrent.futures
 from typing import List, Dict, Any, Optional, Callable
 from .base import LLMProvider
 
+# Shared pool for the blocking Ollama stream iteration. Reused across calls
+# instead of spinning up (and tearing down) a thread pool per request, and
+# kept separate from the loop's default executor used by asyncio.to_thread.
+_STREAM_EXECUTOR = concurrent.futures.ThreadPoolExecutor(
+    max_workers=8, thread_name_prefix="logicore-ollama"
+)
+
 class OllamaProvider(LLMProvider):
     provider_name = "ollama"
     
     def __init__(self, model_name: str, api_key: Optional[str] = None, **kwargs):
+        # Imported here so `import logicore` doesn't pay for (or require) the
+        # ollama client unless an Ollama provider is actually constructed
+        import ollama
+
         self.model_name = model_name
         self.client = ollama.Client(**kwargs)
 
     def _prepare_messages(self, messages: List[Dict[str, Any]]) -> tuple:
         """Prepare and filter messages for Ollama. Returns (filtered_messages, has_images)."""
-        from .utils import extract_content
+        from .utils import extract_content, b64encode_str
         
         filtered_messages = []
         has_images = False
@@ -30,8 +41,7 @@ class OllamaProvider(LLMProvider):
                 ollama_images = []
                 for img in images:
                     if img.get("data"):
-                        import base64
-                        ollama_images.append(base64.b64encode(img["data"]).decode('utf-8'))
+                        ollama_images.append(b64encode_str(img["data"]))
                 
                 if ollama_images:
                     ollama_msg["images"] = ollama_images
@@ -145,6 +155,10 @@ class OllamaProvider(LLMProvider):
         done_event = asyncio.Event()
         result_holder = {"message": None, "error": None}
         
+        def put_token(token):
+            # Hand the token to the loop without wrapping it in a coroutine/future
+            loop.call_soon_threadsafe(token_queue.put_nowait, token)
+
         def sync_stream():
             """Run the blocking stream iteration in a thread."""
             full_content = ""
@@ -184,10 +198,7 @@ class OllamaProvider(LLMProvider):
                             
                         if token:
                             full_content += token
-                            asyncio.run_coroutine_threadsafe(
-                                token_queue.put(token),
-                                loop
-                            )
+                            put_token(token)
                             
                         # Extract thinking
                         think_token = None
@@ -198,10 +209,7 @@ class OllamaProvider(LLMProvider):
                             
                         if think_token:
                             full_content += think_token
-                            asyncio.run_coroutine_threadsafe(
-                                token_queue.put(think_token),
-                                loop
-                            )
+                            put_token(think_token)
                         
                         # Extract tool calls
                         if isinstance(msg, dict):
@@ -222,30 +230,28 @@ class OllamaProvider(LLMProvider):
                 result_holder["error"] = e
             finally:
                 # Signal completion
-                asyncio.run_coroutine_threadsafe(token_queue.put(None), loop)
+                put_token(None)
 
-        loop = asyncio.get_event_loop()
+        loop = asyncio.get_running_loop()
         
         # Start the blocking stream in a thread
-        import concurrent.futures
-        executor = concurrent.futures.ThreadPoolExecutor(max_workers=1)
-        future = executor.submit(sync_stream)
+        future = loop.run_in_executor(_STREAM_EXECUTOR, sync_stream)
         
-        # Process tokens as they arrive
+        # Process tokens as they arrive (callback kind resolved once, not per token)
+        token_is_async = inspect.iscoroutinefunction(on_token)
         while True:
             token = await token_queue.get()
             if token is None:
                 break
             if on_token:
                 # Handle both sync and async callbacks
-                if inspect.iscoroutinefunction(on_token):
+                if token_is_async:
                     await on_token(token)
                 else:
                     on_token(token)
         
         # Wait for thread to complete
-        await asyncio.get_event_loop().run_in_executor(None, future.result)
-        executor.shutdown(wait=False)
+        await future
         
         if result_holder["error"]:
             raise result_holder["error"]
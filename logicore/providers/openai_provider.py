@@ -70,6 +70,7 @@ class OpenAIProvider(LLMProvider):
         accumulated_content = ""
         tool_call_chunks: Dict[int, Dict[str, str]] = {}
 
+        token_is_async = inspect.iscoroutinefunction(on_token)
         for chunk in stream:
             if not chunk or not chunk.choices:
                 continue
@@ -78,7 +79,7 @@ class OpenAIProvider(LLMProvider):
             if delta.content:
                 accumulated_content += delta.content
                 if on_token:
-                    if inspect.iscoroutinefunction(on_token):
+                    if token_is_async:
                         await on_token(delta.content)
                     else:
                         on_token(delta.content)
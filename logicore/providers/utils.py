@@ -1,7 +1,83 @@
+import atexit
 import base64
+import functools
+import mimetypes
+import mmap
+import os
 import re
+import threading
 from typing import List, Dict, Any, Tuple, Optional
 
+try:
+    import pybase64  # SIMD-accelerated, API-compatible with the stdlib codec
+except ImportError:
+    pybase64 = None
+
+_b64 = pybase64 or base64
+
+# Process-wide httpx clients, created on first use so keep-alive connections
+# (and their TLS sessions) are reused across media downloads and raw provider
+# calls instead of being rebuilt for every request.
+_HTTP_LIMITS = {"max_keepalive_connections": 32, "max_connections": 64}
+_client_lock = threading.Lock()
+_shared_client = None
+_shared_async_client = None
+_shared_async_loop = None
+
+def get_shared_client():
+    """Return the shared synchronous ``httpx.Client``."""
+    global _shared_client
+    with _client_lock:
+        if _shared_client is None or _shared_client.is_closed:
+            import httpx
+            _shared_client = httpx.Client(follow_redirects=True, limits=httpx.Limits(**_HTTP_LIMITS))
+        return _shared_client
+
+@atexit.register
+def _close_shared_client():
+    # The async client can't be awaited this late; its loop is gone anyway
+    client = _shared_client
+    if client is not None:
+        client.close()
+
+def get_shared_async_client():
+    """
+    Return the shared ``httpx.AsyncClient`` for the running event loop.
+
+    An async client's connections belong to the loop that opened them, so a
+    new client is created when called from a different loop.
+    """
+    import asyncio
+    global _shared_async_client, _shared_async_loop
+    loop = asyncio.get_running_loop()
+    if _shared_async_client is None or _shared_async_client.is_closed or _shared_async_loop is not loop:
+        import httpx
+        _shared_async_client = httpx.AsyncClient(follow_redirects=True, limits=httpx.Limits(**_HTTP_LIMITS))
+        _shared_async_loop = loop
+    return _shared_async_client
+
+async def aclose_shared_clients():
+    """
+    Close the shared HTTP clients; they are recreated on next use.
+
+    The clients are shared by every provider and agent in the process, so
+    this belongs in application shutdown, not in one agent's cleanup.
+    """
+    global _shared_client, _shared_async_client, _shared_async_loop
+    with _client_lock:
+        client, _shared_client = _shared_client, None
+    if client is not None:
+        client.close()
+    async_client, _shared_async_client, _shared_async_loop = _shared_async_client, None, None
+    if async_client is not None and not async_client.is_closed:
+        try:
+            await async_client.aclose()
+        except RuntimeError:
+            pass  # opened on a loop that has since closed
+
+# More lenient regex to handle common variations (image, audio, video)
+_DATA_URI_RE = re.compile(r"data:((?:image|audio|video)/[a-zA-Z0-9+.-]+);base64,(.+)", re.DOTALL)
+
 def extract_content(message_content: Any) -> Tuple[str, List[Dict[str, Any]]]:
     """
     Extracts text and media (images/audio) from a message content.
@@ -44,7 +120,7 @@ def extract_content(message_content: Any) -> Tuple[str, List[Dict[str, Any]]]:
                                 mime_type, raw_data = parse_media_url(b64_data)
                             else:
                                 mime_type = part.get("mime_type", "image/png")
-                                raw_data = base64.b64decode(b64_data)
+                                raw_data = _b64.b64decode(b64_data)
                             
                             images.append({
                                 "url": None,
@@ -65,46 +141,123 @@ def parse_media_url(url: str) -> Tuple[Optional[str], Optional[bytes]]:
     if not isinstance(url, str):
         return None, None
         
-    # Check for data URI scheme
-    # More lenient regex to handle common variations (image, audio, video)
-    match = re.search(r"data:((?:image|audio|video)/[a-zA-Z0-9+.-]+);base64,(.+)", url, re.DOTALL)
+    # Check for data URI scheme (substring test first so plain paths/URLs skip the regex)
+    match = _DATA_URI_RE.search(url) if "data:" in url else None
     if match:
         mime_type = match.group(1)
         b64_data = match.group(2).strip()
         try:
-            return mime_type, base64.b64decode(b64_data)
+            return mime_type, _b64.b64decode(b64_data)
         except Exception:
             return mime_type, None
             
     # Check for remote URL
     if url.startswith(("http://", "https://")):
         try:
-            import httpx
             headers = {
                 "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36"
             }
-            with httpx.Client(follow_redirects=True, headers=headers, timeout=20.0) as client:
-                response = client.get(url)
-                response.raise_for_status()
-                mime_type = response.headers.get("content-type")
-                return mime_type, response.content
+            response = get_shared_client().get(url, headers=headers, timeout=20.0)
+            response.raise_for_status()
+            mime_type = response.headers.get("content-type")
+            return mime_type, response.content
         except Exception as e:
             print(f"Error downloading media from {url}: {e}")
             return None, None
 
     # Check for local file path
-    import os
-    import mimetypes
     try:
-        if os.path.isfile(url):
-            mime_type, _ = mimetypes.guess_type(url)
-            with open(url, "rb") as f:
-                return mime_type or "application/octet-stream", f.read()
+        data = _read_local_file(url)
+        if data is not None:
+            return mime_type_for_path(url) or "application/octet-stream", data
     except Exception as e:
         print(f"Error reading local file {url}: {e}")
 
     return None, None
 
+@functools.lru_cache(maxsize=256)
+def _mime_for_ext(ext: str) -> Optional[str]:
+    return mimetypes.guess_type("x" + ext)[0]
+
+def mime_type_for_path(path: str) -> Optional[str]:
+    """Guess a file's MIME type from its extension, memoized per extension."""
+    return _mime_for_ext(os.path.splitext(path)[1])
+
+def _read_local_file(path: str) -> Optional[bytes]:
+    """
+    Reads a regular file in one pass, or returns None if ``path`` is not one.
+
+    Uses an unbuffered handle and sizes the read from ``fstat`` on the open
+    descriptor, so there is no separate ``isfile`` stat and no copy through
+    the buffered-IO layer. The open is non-blocking, so a FIFO or device
+    path is rejected by the ``fstat`` check instead of hanging in ``open``.
+    """
+    import stat
+
+    flags = os.O_RDONLY | getattr(os, "O_NONBLOCK", 0) | getattr(os, "O_BINARY", 0)
+    try:
+        fd = os.open(path, flags)
+    except (OSError, ValueError):
+        # Missing, unreadable, over-long or NUL-containing paths are simply
+        # not local files, as os.path.isfile would have said
+        return None
+    try:
+        st = os.fstat(fd)
+    except OSError:
+        os.close(fd)
+        raise
+    if not stat.S_ISREG(st.st_mode):
+        os.close(fd)
+        return None
+    with open(fd, "rb", buffering=0) as f:
+        chunks = []
+        remaining = st.st_size
+        while remaining > 0:
+            chunk = f.read(remaining)
+            if not chunk:
+                break
+            chunks.append(chunk)
+            remaining -= len(chunk)
+        # Pick up anything appended after the stat (or pseudo-files reporting 0)
+        tail = f.read()
+        if tail:
+            chunks.append(tail)
+        return chunks[0] if len(chunks) == 1 else b"".join(chunks)
+
+# Read size for streamed base64 encoding; a multiple of 3 so each chunk
+# encodes without padding and the pieces concatenate into one valid string.
+_B64_CHUNK_SIZE = 3 * 65536
+# Files at least this large are encoded straight from a read-only memory map
+_B64_MMAP_THRESHOLD = 16 * 1024 * 1024
+
+def b64encode_str(data: bytes) -> str:
+    """Base64-encodes bytes to an ASCII str, using pybase64 when installed."""
+    return _b64.b64encode(data).decode("ascii")
+
+def encode_file_base64(path: str, chunk_size: int = _B64_CHUNK_SIZE) -> str:
+    """
+    Base64-encodes a file by streaming it in fixed-size chunks.
+
+    Only one raw chunk is held at a time alongside the growing encoded
+    buffer, instead of the whole file plus its full encoded copy. Large
+    files skip the reads entirely: the encoder consumes a memory map backed
+    by the page cache.
+    """
+    if chunk_size % 3:
+        raise ValueError("chunk_size must be a multiple of 3")
+
+    buf = bytearray()
+    with open(path, "rb") as f:
+        if os.fstat(f.fileno()).st_size >= _B64_MMAP_THRESHOLD:
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                return _b64.b64encode(mm).decode("ascii")
+        while True:
+            chunk = f.read(chunk_size)
+            if not chunk:
+                break
+            buf += _b64.b64encode(chunk)
+    return buf.decode("ascii")
+
 def simplify_tool_schema(schema: Dict[str, Any]) -> Dict[str, Any]:
     """
     Simplifies a complex JSON schema (e.g. from Pydantic v2) for models that 
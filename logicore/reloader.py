@@ -63,10 +63,20 @@ class ModuleReloader(FileSystemEventHandler):
         except Exception as e:
             print(f"[HotReload] Failed to reload {file_path}: {e}")
 
-def start_reloader(watch_dir: str):
+def start_reloader(watch_dir: str, recursive: bool = True):
     """Starts the background file watcher."""
     event_handler = ModuleReloader(watch_dir)
     observer = Observer()
-    observer.schedule(event_handler, watch_dir, recursive=True)
+    observer.schedule(event_handler, watch_dir, recursive=recursive)
     observer.start()
     return observer
+
+def maybe_start_reloader(watch_dir: str, recursive: bool = True):
+    """
+    Starts the file watcher only in development mode (LOGICORE_DEV=1).
+    Returns the observer, or None when hot reload is disabled (the default),
+    so production runs don't pay for filesystem events they never use.
+    """
+    if os.getenv("LOGICORE_DEV", "0").lower() not in ("1", "true", "yes"):
+        return None
+    return start_reloader(watch_dir, recursive=recursive)
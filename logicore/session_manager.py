@@ -5,10 +5,35 @@ Uses the new storage interface for persistence.
 import os
 import json
 import sqlite3
+import queue
+import threading
+from pathlib import Path
 from datetime import datetime
 from typing import Dict, List, Any, Optional
 from contextlib import contextmanager
 
+try:
+    import orjson
+except ImportError:  # optional speedup
+    orjson = None
+
+
+def _dumps(value: Any) -> str:
+    """Serialize message history, using orjson when available."""
+    if orjson is not None:
+        try:
+            return orjson.dumps(value, option=orjson.OPT_NON_STR_KEYS).decode("utf-8")
+        except TypeError:
+            pass  # e.g. integers beyond 64 bits; stdlib handles them
+    return json.dumps(value)
+
+
+def _loads(data: str) -> Any:
+    """Deserialize message history, using orjson when available."""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
 
 class SessionStorage:
     """
@@ -25,21 +50,104 @@ class SessionStorage:
         
         self.db_path = db_path
         os.makedirs(os.path.dirname(db_path), exist_ok=True)
+        
+        # Read-only connections reused by the query methods (created lazily)
+        self._reader_pool: "queue.LifoQueue[sqlite3.Connection]" = queue.LifoQueue()
+        self._reader_count = 0
+        self._reader_lock = threading.Lock()
+        
         self._ensure_tables()
     
+    # Seconds to wait on another process's write lock before failing
+    BUSY_TIMEOUT = 30.0
+    # Upper bound on concurrently open read-only connections
+    READER_POOL_SIZE = 4
+    
     @contextmanager
     def _get_connection(self):
         """Get a database connection."""
-        conn = sqlite3.connect(self.db_path)
+        conn = sqlite3.connect(self.db_path, timeout=self.BUSY_TIMEOUT)
         conn.row_factory = sqlite3.Row
+        # WAL (set once in _ensure_tables) keeps commits durable with NORMAL sync
+        conn.execute("PRAGMA synchronous=NORMAL")
         try:
             yield conn
         finally:
             conn.close()
     
+    @contextmanager
+    def _get_read_connection(self):
+        """
+        Borrow a pooled read-only connection.
+        
+        Under WAL, readers never block the writer (or each other), so listing and
+        loading sessions does not contend with saves. The reads run in
+        one transaction, giving the caller a consistent snapshot across queries.
+        """
+        try:
+            conn = self._reader_pool.get_nowait()
+        except queue.Empty:
+            conn = None
+            with self._reader_lock:
+                if self._reader_count < self.READER_POOL_SIZE:
+                    self._reader_count += 1
+                    create = True
+                else:
+                    create = False
+            if create:
+                try:
+                    conn = sqlite3.connect(
+                        Path(os.path.abspath(self.db_path)).as_uri() + "?mode=ro",
+                        uri=True,
+                        timeout=self.BUSY_TIMEOUT,
+                        check_same_thread=False,
+                    )
+                except Exception:
+                    with self._reader_lock:
+                        self._reader_count -= 1
+                    raise
+                conn.row_factory = sqlite3.Row
+            else:
+                try:
+                    conn = self._reader_pool.get(timeout=self.BUSY_TIMEOUT)
+                except queue.Empty:
+                    raise sqlite3.OperationalError("timed out waiting for a pooled read connection")
+        broken = False
+        try:
+            conn.execute("BEGIN")
+            try:
+                yield conn
+            finally:
+                conn.rollback()
+        except sqlite3.Error:
+            broken = True
+            raise
+        finally:
+            # Every exit path gives the connection back, or retires it if
+            # SQLite itself failed on it, so the pool can never drain
+            if broken:
+                conn.close()
+                with self._reader_lock:
+                    self._reader_count -= 1
+            else:
+                self._reader_pool.put(conn)
+    
+    def close(self):
+        """Close pooled read-only connections."""
+        while True:
+            try:
+                conn = self._reader_pool.get_nowait()
+            except queue.Empty:
+                break
+            conn.close()
+            with self._reader_lock:
+                self._reader_count -= 1
+    
     def _ensure_tables(self):
         """Ensure required tables exist."""
         with self._get_connection() as conn:
+            # Persistent per database file: lets readers run alongside the writer
+            conn.execute("PRAGMA journal_mode=WAL")
             cursor = conn.cursor()
             
             cursor.execute("""
@@ -115,13 +223,66 @@ class SessionStorage:
             cursor = conn.cursor()
             cursor.execute(
                 "INSERT OR REPLACE INTO agent_state (session_id, key, value, updated_at) VALUES (?, ?, ?, ?)",
-                (session_id, key, json.dumps(value), now)
+                (session_id, key, _dumps(value), now)
             )
             conn.commit()
     
+    def save_messages(self, session_id: str, messages: List[Dict[str, Any]], metadata: Dict = None, default_metadata: Dict = None):
+        """
+        Atomically save session messages together with activity and metadata.
+        
+        All writes happen in a single IMMEDIATE transaction, so processes sharing
+        the database serialize on SQLite's write lock and a crash mid-save cannot
+        leave a half-updated session behind.
+        
+        Note: SQLite file locking is unreliable on network filesystems (NFS, SMB);
+        keep the database on local disk when several processes write to it.
+        """
+        now = datetime.now()
+        with self._get_connection() as conn:
+            cursor = conn.cursor()
+            cursor.execute("BEGIN IMMEDIATE")
+            try:
+                cursor.execute(
+                    "INSERT OR IGNORE INTO sessions (session_id, created_at, last_activity, metadata) VALUES (?, ?, ?, ?)",
+                    (session_id, now, now, json.dumps(metadata or default_metadata or {}))
+                )
+                cursor.execute(
+                    "UPDATE sessions SET last_activity = ? WHERE session_id = ?",
+                    (now, session_id)
+                )
+                
+                if metadata:
+                    self._merge_metadata(cursor, session_id, metadata)
+                
+                cursor.execute(
+                    "INSERT OR REPLACE INTO agent_state (session_id, key, value, updated_at) VALUES (?, ?, ?, ?)",
+                    (session_id, "messages", _dumps(messages), now)
+                )
+                conn.commit()
+            except Exception:
+                conn.rollback()
+                raise
+    
+    def _merge_metadata(self, cursor: sqlite3.Cursor, session_id: str, metadata: Dict):
+        """Merge metadata into the session row using the caller's cursor/transaction."""
+        cursor.execute("SELECT metadata FROM sessions WHERE session_id = ?", (session_id,))
+        row = cursor.fetchone()
+        existing = {}
+        if row and row["metadata"]:
+            try:
+                existing = json.loads(row["metadata"])
+            except Exception:
+                pass
+        existing.update(metadata)
+        cursor.execute(
+            "UPDATE sessions SET metadata = ? WHERE session_id = ?",
+            (json.dumps(existing), session_id)
+        )
+    
     def load_state(self, session_id: str, key: str) -> Optional[Any]:
         """Load a state value."""
-        with self._get_connection() as conn:
+        with self._get_read_connection() as conn:
             cursor = conn.cursor()
             cursor.execute(
                 "SELECT value FROM agent_state WHERE session_id = ? AND key = ?",
@@ -131,7 +292,7 @@ class SessionStorage:
             
             if row:
                 try:
-                    return json.loads(row["value"])
+                    return _loads(row["value"])
                 except Exception:
                     return row["value"]
             return None
@@ -149,7 +310,7 @@ class SessionStorage:
     
     def list_sessions(self) -> List[Dict[str, Any]]:
         """List all sessions."""
-        with self._get_connection() as conn:
+        with self._get_read_connection() as conn:
             cursor = conn.cursor()
             cursor.execute(
                 "SELECT session_id, created_at, last_activity, metadata FROM sessions ORDER BY last_activity DESC"
@@ -167,7 +328,7 @@ class SessionStorage:
                 msg_count = 0
                 if msg_row:
                     try:
-                        msgs = json.loads(msg_row["value"])
+                        msgs = _loads(msg_row["value"])
                         msg_count = len([m for m in msgs if isinstance(m, dict) and m.get("role") == "user"])
                     except Exception:
                         pass
@@ -199,19 +360,13 @@ class SessionManager:
         if not messages:
             return
 
-        # Ensure session exists
-        if not self.storage.load_state(session_id, "messages"):
-            self.storage.create_session(session_id, metadata=metadata or {"source": "logicore_cli"})
-             
-        # Update activity timestamp
-        self.storage.update_session_activity(session_id)
-        
-        # Update metadata if provided
-        if metadata:
-            self.storage.update_session_metadata(session_id, metadata)
-        
-        # Save messages
-        self.storage.save_state(session_id, "messages", messages)
+        # Create-if-missing, activity, metadata and messages in one transaction
+        self.storage.save_messages(
+            session_id,
+            messages,
+            metadata=metadata,
+            default_metadata={"source": "logicore_cli"}
+        )
 
     def load_session(self, session_id: str) -> Optional[List[Dict[str, Any]]]:
         """Load session messages from persistent storage."""
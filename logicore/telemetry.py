@@ -449,12 +449,13 @@ class TelemetryTracker:
         _context_fetcher.register_fetcher(provider, fetcher)
 
     def _get_session(self, session_id: str) -> SessionMetrics:
-        if session_id not in self.sessions:
-            self.sessions[session_id] = SessionMetrics(
+        session = self.sessions.get(session_id)
+        if session is None:
+            session = self.sessions[session_id] = SessionMetrics(
                 session_id=session_id,
                 started_at=datetime.now()
             )
-        return self.sessions[session_id]
+        return session
 
     def record_request(
         self,
@@ -142,87 +142,97 @@ class NotesTool(BaseTool):
     
     def run(self, action: str, title: str = None, content: str = None,
             query: str = None, note_id: int = None, tags: List[str] = None) -> ToolResult:
+        handler = self._ACTIONS.get(action)
+        if handler is None:
+            return ToolResult(success=False, error=f"Unknown action: {action}")
         try:
-            if action == "add":
-                if not title or not content:
-                    return ToolResult(success=False, error="Title and content are required for 'add'")
-                
-                note = {
-                    "id": self.notes["next_id"],
-                    "title": title,
-                    "content": content,
-                    "tags": tags or [],
-                    "created_at": datetime.now().isoformat(),
-                    "updated_at": datetime.now().isoformat()
-                }
-                self.notes["items"].append(note)
-                self.notes["next_id"] += 1
-                self._save_notes()
-                
-                return ToolResult(success=True, content=f"Note #{note['id']} created: {title}")
-            
-            elif action == "list":
-                if not self.notes["items"]:
-                    return ToolResult(success=True, content="No notes found.")
-                
-                lines = ["# Notes", ""]
-                for note in self.notes["items"]:
-                    tags_str = f" [{', '.join(note['tags'])}]" if note['tags'] else ""
-                    lines.append(f"- **#{note['id']}** {note['title']}{tags_str}")
-                
-                return ToolResult(success=True, content="\n".join(lines))
-            
-            elif action == "search":
-                if not query:
-                    return ToolResult(success=False, error="Query is required for 'search'")
-                
-                query_lower = query.lower()
-                matches = [
-                    note for note in self.notes["items"]
-                    if query_lower in note["title"].lower() 
-                    or query_lower in note["content"].lower()
-                    or any(query_lower in tag.lower() for tag in note.get("tags", []))
-                ]
-                
-                if not matches:
-                    return ToolResult(success=True, content=f"No notes matching '{query}'")
-                
-                lines = [f"# Search Results for '{query}'", ""]
-                for note in matches:
-                    lines.append(f"## #{note['id']}: {note['title']}")
-                    lines.append(note['content'][:200] + "..." if len(note['content']) > 200 else note['content'])
-                    lines.append("")
-                
-                return ToolResult(success=True, content="\n".join(lines))
-            
-            elif action == "get":
-                if note_id is None:
-                    return ToolResult(success=False, error="Note ID is required for 'get'")
-                
-                note = next((n for n in self.notes["items"] if n["id"] == note_id), None)
-                if not note:
-                    return ToolResult(success=False, error=f"Note #{note_id} not found")
-                
-                return ToolResult(success=True, content=json.dumps(note, indent=2))
-            
-            elif action == "delete":
-                if note_id is None:
-                    return ToolResult(success=False, error="Note ID is required for 'delete'")
-                
-                initial_count = len(self.notes["items"])
-                self.notes["items"] = [n for n in self.notes["items"] if n["id"] != note_id]
-                
-                if len(self.notes["items"]) == initial_count:
-                    return ToolResult(success=False, error=f"Note #{note_id} not found")
-                
-                self._save_notes()
-                return ToolResult(success=True, content=f"Note #{note_id} deleted")
-            
-            else:
-                return ToolResult(success=False, error=f"Unknown action: {action}")
-            
+            return handler(self, title=title, content=content, query=query, note_id=note_id, tags=tags)
         except Exception as e:
             return ToolResult(success=False, error=str(e))
+    
+    def _add(self, title, content, tags, **_) -> ToolResult:
+        if not title or not content:
+            return ToolResult(success=False, error="Title and content are required for 'add'")
+        
+        note = {
+            "id": self.notes["next_id"],
+            "title": title,
+            "content": content,
+            "tags": tags or [],
+            "created_at": datetime.now().isoformat(),
+            "updated_at": datetime.now().isoformat()
+        }
+        self.notes["items"].append(note)
+        self.notes["next_id"] += 1
+        self._save_notes()
+        
+        return ToolResult(success=True, content=f"Note #{note['id']} created: {title}")
+    
+    def _list(self, **_) -> ToolResult:
+        if not self.notes["items"]:
+            return ToolResult(success=True, content="No notes found.")
+        
+        lines = ["# Notes", ""]
+        for note in self.notes["items"]:
+            tags_str = f" [{', '.join(note['tags'])}]" if note['tags'] else ""
+            lines.append(f"- **#{note['id']}** {note['title']}{tags_str}")
+        
+        return ToolResult(success=True, content="\n".join(lines))
+    
+    def _search(self, query, **_) -> ToolResult:
+        if not query:
+            return ToolResult(success=False, error="Query is required for 'search'")
+        
+        query_lower = query.lower()
+        matches = [
+            note for note in self.notes["items"]
+            if query_lower in note["title"].lower() 
+            or query_lower in note["content"].lower()
+            or any(query_lower in tag.lower() for tag in note.get("tags", []))
+        ]
+        
+        if not matches:
+            return ToolResult(success=True, content=f"No notes matching '{query}'")
+        
+        lines = [f"# Search Results for '{query}'", ""]
+        for note in matches:
+            lines.append(f"## #{note['id']}: {note['title']}")
+            lines.append(note['content'][:200] + "..." if len(note['content']) > 200 else note['content'])
+            lines.append("")
+        
+        return ToolResult(success=True, content="\n".join(lines))
+    
+    def _get(self, note_id, **_) -> ToolResult:
+        if note_id is None:
+            return ToolResult(success=False, error="Note ID is required for 'get'")
+        
+        note = next((n for n in self.notes["items"] if n["id"] == note_id), None)
+        if not note:
+            return ToolResult(success=False, error=f"Note #{note_id} not found")
+        
+        return ToolResult(success=True, content=json.dumps(note, indent=2))
+    
+    def _delete(self, note_id, **_) -> ToolResult:
+        if note_id is None:
+            return ToolResult(success=False, error="Note ID is required for 'delete'")
+        
+        initial_count = len(self.notes["items"])
+        self.notes["items"] = [n for n in self.notes["items"] if n["id"] != note_id]
+        
+        if len(self.notes["items"]) == initial_count:
+            return ToolResult(success=False, error=f"Note #{note_id} not found")
+        
+        self._save_notes()
+        return ToolResult(success=True, content=f"Note #{note_id} deleted")
+    
+    # action -> handler, built once with the class
+    _ACTIONS = {
+        "add": _add,
+        "list": _list,
+        "search": _search,
+        "get": _get,
+        "delete": _delete,
+    }
 
 
 # ============== Memory Tool ==============
@@ -2,6 +2,7 @@ import subprocess
 import shlex
 import os
 import sys
+import tempfile
 from typing import Literal, Optional
 from pydantic import BaseModel, Field
 from .base import BaseTool, ToolResult
@@ -92,8 +93,6 @@ class CodeExecuteTool(BaseTool):
             # We run python -c "code"
             # This requires careful escaping if we really want to support complex code.
             # A better approach is writing to a temp file.
-            import tempfile
-            
             with tempfile.NamedTemporaryFile(mode='w', suffix='.py', delete=False, encoding='utf-8') as tmp:
                 tmp.write(code)
                 tmp_path = tmp.name
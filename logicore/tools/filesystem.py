@@ -3,6 +3,8 @@ import re
 import fnmatch
 import difflib
 import shutil
+from pathlib import Path
+from stat import S_ISREG
 from typing import List, Optional, Literal, Set, Union
 from pydantic import BaseModel, Field
 from .base import BaseTool, ToolResult
@@ -80,11 +82,14 @@ class ReadFileTool(BaseTool):
     def run(self, file_path: str, start_line: int = None, end_line: int = None) -> ToolResult:
         try:
             abs_path = os.path.abspath(file_path)
-            if not os.path.exists(abs_path):
+            # One stat serves the existence, type and size checks
+            try:
+                st = os.stat(abs_path)
+            except OSError:
                 return ToolResult(success=False, error="File not found")
-            if not os.path.isfile(abs_path):
+            if not S_ISREG(st.st_mode):
                 return ToolResult(success=False, error="Path is not a file")
-            if os.path.getsize(abs_path) > 50 * 1024 * 1024: # 50MB limit
+            if st.st_size > 50 * 1024 * 1024: # 50MB limit
                 return ToolResult(success=False, error="File too large (max 50MB)")
 
             with open(abs_path, 'r', encoding='utf-8') as f:
@@ -508,11 +513,23 @@ class ListFilesTool(BaseTool):
 
             ignore_list = ignore_patterns if ignore_patterns else ['__pycache__', '.git', 'node_modules', '*.pyc', 'venv', '.env']
             
+            # Exact names go in a set; glob patterns collapse into one regex,
+            # so each entry costs a hash lookup plus at most one match.
+            ignore_names = set()
+            ignore_globs = []
+            for pat in ignore_list:
+                pat = os.path.normcase(pat)
+                if any(c in pat for c in '*?['):
+                    ignore_globs.append(fnmatch.translate(pat))
+                else:
+                    ignore_names.add(pat)
+            ignore_re = re.compile('|'.join(ignore_globs)) if ignore_globs else None
+
             def should_ignore(name):
-                for pat in ignore_list:
-                    if fnmatch.fnmatch(name, pat):
-                        return True
-                return False
+                name = os.path.normcase(name)
+                if name in ignore_names:
+                    return True
+                return bool(ignore_re and ignore_re.match(name))
 
             if tree:
                 # Tree view generation
@@ -582,9 +599,6 @@ class SearchFilesTool(BaseTool):
             exclude_dirs: Optional[Union[str, List[str]]] = None, exclude_files: Optional[Union[str, List[str]]] = None,
             max_results: int = 100, context_lines: int = 0, group_by_file: bool = False) -> ToolResult:
         try:
-            from pathlib import Path
-            import re, fnmatch, os
-            
             base_dir = Path(directory).resolve()
             if not base_dir.is_dir():
                 return ToolResult(success=False, error="Directory not found.")
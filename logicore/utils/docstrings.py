@@ -0,0 +1,7 @@
+import re
+
+# Patterns for pulling per-parameter descriptions out of tool docstrings:
+# Sphinx ":param name: ..." lines, and Google-style "name (type): ..." entries
+# under an "Args:" header.
+SPHINX_PARAM_RE = re.compile(r':param\s+(\w+)\s*:(.*)')
+GOOGLE_ARG_RE = re.compile(r'(\w+)\s*(?:\([^)]*\))?\s*:(.*)')
@@ -0,0 +1,218 @@
+import asyncio
+
+import pytest
+
+from logicore.agents import agent as agent_module
+from logicore.agents.agent import Agent, AgentSession, _classify_llm_error
+
+
+def _bare_agent(**attrs):
+    """Agent with only the attributes a test needs (no provider or tools loaded)."""
+    agent = Agent.__new__(Agent)
+    agent.debug = False
+    agent.internal_tools = []
+    agent.disabled_tools = set()
+    agent.mcp_managers = []
+    agent._tools_cache = None
+    agent._tools_cache_key = None
+    agent.__dict__.update(attrs)
+    return agent
+
+
+def _tool(name):
+    return {"type": "function", "function": {"name": name, "parameters": {}}}
+
+
+# --- history compaction ---
+
+def _session(max_history, **kwargs):
+    return AgentSession("s", "system prompt", max_history_messages=max_history, **kwargs)
+
+
+def test_compaction_keeps_system_and_opens_with_user():
+    session = _session(8)
+    for i in range(12):
+        session.add_message({"role": "user" if i % 2 == 0 else "assistant", "content": str(i)})
+    assert len(session.messages) <= 8
+    assert session.messages[0] == {"role": "system", "content": "system prompt"}
+    assert session.messages[1]["role"] == "user"
+    assert session.messages[1]["content"].startswith("[earlier context:")
+    assert session.messages[-1]["content"] == "11"
+
+
+def test_compaction_counts_only_original_messages():
+    session = _session(4, summary_ratio=0.5)
+    for i in range(10):
+        session.add_message({"role": "user", "content": str(i)})
+    kept = [m["content"] for m in session.messages[2:]]
+    omitted = 10 - len(kept)
+    assert session.omitted_messages == omitted
+    assert session.messages[1]["content"] == f"[earlier context: …{omitted} messages omitted…]"
+
+
+def test_compaction_does_not_orphan_tool_results():
+    session = _session(5, summary_ratio=0.4)
+    session.messages.extend([
+        {"role": "user", "content": "q"},
+        {"role": "assistant", "content": "", "tool_calls": [{"id": "1"}, {"id": "2"}]},
+        {"role": "tool", "tool_call_id": "1", "content": "a"},
+        {"role": "tool", "tool_call_id": "2", "content": "b"},
+    ])
+    session.add_message({"role": "assistant", "content": "done"})
+    # The cut would fall between the tool results; both go with their call
+    assert [m["role"] for m in session.messages] == ["system", "user", "assistant"]
+    assert session.messages[-1]["content"] == "done"
+
+
+def test_compaction_uses_summarizer():
+    seen = []
+    session = _session(4, summary_ratio=0.5, summarizer=lambda dropped: seen.extend(dropped) or "recap")
+    for i in range(4):
+        session.add_message({"role": "user", "content": str(i)})
+    assert [m["content"] for m in seen] == ["0", "1"]
+    assert session.messages[1] == {"role": "user", "content": "[earlier context: recap]"}
+
+
+def test_clear_history_resets_omitted_count():
+    session = _session(4)
+    for i in range(10):
+        session.add_message({"role": "user", "content": str(i)})
+    session.clear_history()
+    assert session.messages == [{"role": "system", "content": "system prompt"}]
+    assert session.omitted_messages == 0
+
+
+# --- provider error handling ---
+
+class _StatusError(Exception):
+    def __init__(self, message, status_code):
+        super().__init__(message)
+        self.status_code = status_code
+
+
+@pytest.mark.parametrize("message, error, kind", [
+    ("rate limit exceeded", None, "rate_limit"),
+    ("error code: 429 - too many requests", None, "rate_limit"),
+    ("slow down", _StatusError("slow down", 429), "rate_limit"),
+    ("model output must contain output text or tool calls", None, "empty_response"),
+    ("status code: 500", None, "empty_response"),
+    ("prompt used 1429 tokens", None, "other"),
+    ("invalid api key", _StatusError("invalid api key", 401), "other"),
+])
+def test_classify_llm_error(message, error, kind):
+    assert _classify_llm_error(message, error) == kind
+
+
+class _Gateway:
+    def __init__(self, *outcomes):
+        self.outcomes = list(outcomes)
+        self.calls = []
+
+    async def chat(self, messages, tools=None):
+        self.calls.append(tools)
+        outcome = self.outcomes.pop(0)
+        if isinstance(outcome, BaseException):
+            raise outcome
+        return outcome
+
+
+@pytest.fixture
+def no_backoff(monkeypatch):
+    monkeypatch.setattr(agent_module, "_backoff_delay", lambda attempt, base: 0)
+
+
+@pytest.mark.asyncio
+async def test_retry_chat_returns_first_success(no_backoff):
+    tools = [_tool("read_file")]
+    agent = _bare_agent(gateway=_Gateway(RuntimeError("empty"), "ok"))
+    assert await agent._retry_chat([], tools, "rate_limit") == "ok"
+    assert agent.gateway.calls == [tools, tools]
+
+
+@pytest.mark.asyncio
+async def test_retry_chat_falls_back_without_tools(no_backoff):
+    tools = [_tool("read_file")]
+    agent = _bare_agent(gateway=_Gateway(RuntimeError("empty"), "plain"))
+    assert await agent._retry_chat([], tools) == "plain"
+    assert agent.gateway.calls == [tools, None]
+
+
+@pytest.mark.asyncio
+async def test_retry_chat_stops_when_tools_unsupported(no_backoff):
+    tools = [_tool("read_file")]
+    agent = _bare_agent(gateway=_Gateway(RuntimeError("model does not support tools"), "plain"))
+    assert await agent._retry_chat([], tools, "rate_limit") == "plain"
+    assert agent.gateway.calls == [tools, None]
+
+
+@pytest.mark.asyncio
+async def test_retry_chat_propagates_final_error(no_backoff):
+    agent = _bare_agent(gateway=_Gateway(RuntimeError("empty"), ValueError("still broken")))
+    with pytest.raises(ValueError):
+        await agent._retry_chat([], [_tool("read_file")])
+
+
+# --- tool list cache ---
+
+class _Manager:
+    def __init__(self, tools):
+        self.tools = tools
+        self.sessions = {}
+        self.server_tools_map = {}
+
+    async def get_tools(self):
+        return self.tools
+
+
+@pytest.mark.asyncio
+async def test_tools_cache_invalidated_by_toolset_changes():
+    agent = _bare_agent(internal_tools=[_tool("read_file")])
+    first = await agent.get_all_tools()
+    assert await agent.get_all_tools() is first
+
+    agent.internal_tools.append(_tool("create_file"))
+    assert [t["function"]["name"] for t in await agent.get_all_tools()] == ["read_file", "create_file"]
+
+    agent.disabled_tools.add("create_file")
+    assert [t["function"]["name"] for t in await agent.get_all_tools()] == ["read_file"]
+
+    manager = _Manager([_tool("excel_read")])
+    agent.mcp_managers.append(manager)
+    assert len(await agent.get_all_tools()) == 2
+
+    manager.server_tools_map["excel_read"] = "excel"
+    agent.disabled_tools.add("mcp_server:excel")
+    assert len(await agent.get_all_tools()) == 1
+
+
+# --- tool dispatch ---
+
+@pytest.mark.asyncio
+async def test_side_effect_tools_run_in_order():
+    events = []
+
+    async def execute(name, args, session_id):
+        events.append(("start", name))
+        await asyncio.sleep(0.01 if name == "create_file" else 0)
+        events.append(("end", name))
+        if name == "delete_file":
+            raise RuntimeError("boom")
+        return name
+
+    agent = _bare_agent()
+    agent._execute_tool = execute
+    calls = [("read_file", {}), ("list_files", {}), ("create_file", {}),
+             ("execute_command", {}), ("delete_file", {}), ("read_file", {})]
+    results = await agent._execute_approved(calls, "s")
+
+    assert results[:4] == ["read_file", "list_files", "create_file", "execute_command"]
+    assert isinstance(results[4], RuntimeError)
+    assert results[5] == "read_file"
+    # The two leading reads overlap; each side-effecting call finishes before the next starts
+    assert events[:2] == [("start", "read_file"), ("start", "list_files")]
+    assert events[4:] == [
+        ("start", "create_file"), ("end", "create_file"),
+        ("start", "execute_command"), ("end", "execute_command"),
+        ("start", "delete_file"), ("end", "delete_file"),
+        ("start", "read_file"), ("end", "read_file"),
+    ]
@@ -0,0 +1,108 @@
+import os
+
+import pytest
+
+from logicore.document_handlers import cache
+from logicore.document_handlers.base import BaseDocumentHandler
+
+
+class _CountingHandler(cache.CachedTextMixin, BaseDocumentHandler):
+    """Minimal cached handler; ``ocr_result`` stands in for an OCR call."""
+
+    ocr_result = "page text"
+
+    def __init__(self, file_path):
+        super().__init__(file_path)
+        self.parses = 0
+
+    def _parse(self):
+        self.parses += 1
+        with open(self.file_path, encoding="utf-8") as f:
+            self._text = f.read() + self._check_ocr(self.ocr_result)
+        self._metadata = {"parses": self.parses}
+
+
+@pytest.fixture
+def cache_dir(tmp_path, monkeypatch):
+    path = tmp_path / "cache"
+    monkeypatch.setenv("LOGICORE_DOC_CACHE_DIR", str(path))
+    monkeypatch.delenv("LOGICORE_DOC_CACHE", raising=False)
+    return path
+
+
+@pytest.fixture
+def doc(tmp_path):
+    path = tmp_path / "doc.txt"
+    path.write_text("hello ", encoding="utf-8")
+    return path
+
+
+def test_unchanged_file_served_from_cache(cache_dir, doc):
+    first = _CountingHandler(str(doc))
+    assert first.get_text() == "hello page text"
+    second = _CountingHandler(str(doc))
+    assert second.get_text() == "hello page text"
+    assert second.parses == 0
+    assert second.get_metadata() == {"parses": 1}
+
+
+def test_modified_file_misses_cache(cache_dir, doc):
+    _CountingHandler(str(doc)).load()
+    doc.write_text("changed content ", encoding="utf-8")
+    handler = _CountingHandler(str(doc))
+    assert handler.get_text() == "changed content page text"
+    assert handler.parses == 1
+
+
+def test_key_includes_version_and_vision(cache_dir, doc, monkeypatch):
+    monkeypatch.setattr(cache, "_vision_installed", lambda: True)
+    with_vision = cache._cache_path(str(doc))
+    monkeypatch.setattr(cache, "_vision_installed", lambda: False)
+    without_vision = cache._cache_path(str(doc))
+    monkeypatch.setattr(cache, "_CACHE_VERSION", cache._CACHE_VERSION + 1)
+    next_version = cache._cache_path(str(doc))
+    assert len({with_vision, without_vision, next_version}) == 3
+    assert os.path.dirname(with_vision) == str(cache_dir)
+
+
+def test_ocr_failure_not_cached(cache_dir, doc):
+    failing = _CountingHandler(str(doc))
+    failing.ocr_result = "[Ollama Vision Failed: ollama is not installed]"
+    failing.load()
+    assert failing._ocr_incomplete
+    assert not cache_dir.exists() or not any(cache_dir.iterdir())
+
+    retried = _CountingHandler(str(doc))
+    assert retried.get_text() == "hello page text"
+    assert retried.parses == 1
+
+
+def test_entries_are_private(cache_dir, doc):
+    _CountingHandler(str(doc)).load()
+    (entry,) = cache_dir.iterdir()
+    assert entry.stat().st_mode & 0o777 == cache._FILE_MODE
+    assert cache_dir.stat().st_mode & 0o777 == cache._DIR_MODE
+
+
+def test_disabled_cache(cache_dir, doc, monkeypatch):
+    monkeypatch.setenv("LOGICORE_DOC_CACHE", "0")
+    _CountingHandler(str(doc)).load()
+    handler = _CountingHandler(str(doc))
+    handler.load()
+    assert handler.parses == 1
+    assert not cache_dir.exists()
+
+
+def test_prune_drops_stale_and_world_readable(tmp_path, monkeypatch):
+    monkeypatch.setattr(cache, "MAX_CACHE_AGE_DAYS", 1)
+    fresh, stale, shared = (tmp_path / f"{name}.json" for name in ("fresh", "stale", "shared"))
+    for path in (fresh, stale, shared):
+        path.write_text("{}")
+    fresh.chmod(0o600)
+    stale.chmod(0o600)
+    shared.chmod(0o644)
+    os.utime(stale, (0, 0))
+    cache._prune(str(tmp_path))
+    assert fresh.exists()
+    assert not stale.exists()
+    assert not shared.exists()
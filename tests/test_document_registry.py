@@ -0,0 +1,65 @@
+import os
+
+import pytest
+
+from logicore.document_handlers import BinaryFileError, get_handler
+from logicore.document_handlers.registry import _check_not_binary, _extension
+
+
+@pytest.mark.parametrize("path", [
+    "report.pdf",
+    "REPORT.PDF",
+    "dir/Notes.Md",
+    "dir.d/Makefile",
+    ".bashrc",
+    "dir/.bashrc",
+    "..hidden",
+    "archive.tar.gz",
+    "trailing.",
+    "",
+    "/abs/path/file.TXT",
+])
+def test_extension_matches_splitext(path):
+    assert _extension(path) == os.path.splitext(path)[1].lower()
+
+
+def _pe_header(signature=b"PE\0\0"):
+    header = bytearray(0x40)
+    header[:2] = b"MZ"
+    header[0x3C:0x40] = (0x40).to_bytes(4, "little")
+    return bytes(header) + signature
+
+
+@pytest.mark.parametrize("content", [
+    b"\x7fELF\x02\x01\x01" + b"\0" * 64,
+    b"PK\x03\x04" + b"\0" * 64,
+    b"\x89PNG\r\n\x1a\n",
+    b"%PDF-1.7\n",
+    _pe_header(),
+])
+def test_binary_headers_rejected(tmp_path, content):
+    path = tmp_path / "blob.unknownext"
+    path.write_bytes(content)
+    with pytest.raises(BinaryFileError):
+        _check_not_binary(str(path))
+    with pytest.raises(BinaryFileError):
+        get_handler(str(path))
+
+
+@pytest.mark.parametrize("content", [
+    b"MZ is how this note starts, but it is plain text." + b"x" * 64,
+    _pe_header(signature=b"NOPE"),
+    b"MZ",
+    b"",
+])
+def test_text_with_mz_prefix_accepted(tmp_path, content):
+    path = tmp_path / "note.unknownext"
+    path.write_bytes(content)
+    _check_not_binary(str(path))
+    assert type(get_handler(str(path))).__name__ == "TextHandler"
+
+
+def test_missing_file_left_to_handler(tmp_path):
+    _check_not_binary(str(tmp_path / "missing.unknownext"))
+    with pytest.raises(FileNotFoundError):
+        get_handler(str(tmp_path / "missing.unknownext"))
@@ -0,0 +1,51 @@
+"""Pre-split prompt rendering must match the str.format templates it replaces."""
+
+import pytest
+
+from logicore.config import prompts
+
+
+TEMPLATES = [
+    prompts._compose(body + footer) for body, footer in prompts._ROLE_RECIPES.values()
+] + [prompts._SMART_SOLO_TEMPLATE, prompts._SMART_PROJECT_TEMPLATE]
+
+
+def _fields(template):
+    return {name for _, name in prompts._split_template(template) if name is not None}
+
+
+@pytest.mark.parametrize("template", TEMPLATES)
+def test_render_matches_format(template):
+    values = {name: f"<{name}>" for name in _fields(template)}
+    assert prompts._render(prompts._split_template(template), values) == template.format(**values)
+
+
+@pytest.mark.parametrize("template", TEMPLATES)
+def test_render_str_converts_values(template):
+    values = {name: None for name in _fields(template)}
+    assert prompts._render(prompts._split_template(template), values) == template.format(**values)
+
+
+def test_bind_then_render_matches_format():
+    template = prompts._SMART_PROJECT_TEMPLATE
+    values = {name: f"<{name}>" for name in _fields(template)}
+    values["project_id"] = 42
+    late = {"current_time": values.pop("current_time"), "cwd": values.pop("cwd")}
+    bound = prompts._bind(prompts._split_template(template), values)
+    assert prompts._render(bound, late) == template.format(**values, **late)
+
+
+def test_system_prompt_is_static_plus_footer(monkeypatch):
+    monkeypatch.setattr(prompts, "_timestamp", lambda: "2024-01-01 00:00:00")
+    for role in ("general", "engineer", "copilot", "mcp", "unknown"):
+        full = prompts.get_system_prompt("m", role)
+        assert full == prompts.get_system_prompt_static(role) + prompts.get_system_prompt_footer("m", role)
+        assert prompts.get_system_prompt_bytes("m", role) == full.encode("utf-8")
+
+
+def test_non_str_model_name():
+    assert "You are powered by None." in prompts.get_system_prompt(None)
+    assert "- Model: None\n" in prompts.get_smart_agent_solo_prompt(None)
+    project = prompts.get_smart_agent_project_prompt(7, {"project_id": 3})
+    assert "- Model: 7\n" in project
+    assert 'project_id="3"' in project
@@ -0,0 +1,69 @@
+import sqlite3
+import threading
+
+import pytest
+
+from logicore.session_manager import SessionManager, SessionStorage
+
+
+@pytest.fixture
+def storage(tmp_path):
+    storage = SessionStorage(str(tmp_path / "sessions.db"))
+    yield storage
+    storage.close()
+
+
+def test_round_trip(storage):
+    manager = SessionManager(storage)
+    messages = [{"role": "user", "content": "hi"}, {"role": "assistant", "content": "hello"}]
+    manager.save_session("s1", messages, {"title": "greeting"})
+    assert manager.load_session("s1") == messages
+    assert manager.session_exists("s1")
+    assert not manager.session_exists("missing")
+
+
+def test_reader_returned_after_caller_error(storage):
+    storage.READER_POOL_SIZE = 1
+    for _ in range(3):
+        with pytest.raises(KeyError):
+            with storage._get_read_connection():
+                raise KeyError("caller bug")
+    assert storage._reader_pool.qsize() == 1
+    assert storage._reader_count == 1
+    assert storage.load_state("s1", "messages") is None
+
+
+def test_reader_retired_after_sqlite_error(storage):
+    with pytest.raises(sqlite3.OperationalError):
+        with storage._get_read_connection() as conn:
+            conn.execute("SELECT * FROM no_such_table")
+    assert storage._reader_count == 0
+    assert storage._reader_pool.qsize() == 0
+    assert storage.load_state("s1", "messages") is None
+
+
+def test_exhausted_pool_times_out(storage):
+    storage.READER_POOL_SIZE = 1
+    storage.BUSY_TIMEOUT = 0.05
+    with storage._get_read_connection():
+        result = []
+
+        def borrow():
+            try:
+                with storage._get_read_connection():
+                    result.append("borrowed")
+            except sqlite3.OperationalError as e:
+                result.append(e)
+
+        worker = threading.Thread(target=borrow)
+        worker.start()
+        worker.join(5)
+    assert isinstance(result[0], sqlite3.OperationalError)
+    assert storage._reader_pool.qsize() == 1
+
+
+def test_close_empties_pool(storage):
+    storage.load_state("s1", "messages")
+    storage.close()
+    assert storage._reader_count == 0
+    assert storage._reader_pool.qsize() == 0